@@ -2,6 +2,8 @@
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 class BaseAgent(ABC):
     """Abstract base for agents that interact with KlondikeEnv.
@@ -22,13 +24,39 @@ class BaseAgent(ABC):
         """Select an action given an observation from KlondikeEnv.
 
         Args:
-            obs: observation returned by KlondikeEnv.reset() or .step()
+            obs: observation returned by KlondikeEnv.reset() or .step().
 
         Returns:
             Integer action index into the environment's action space.
         """
         ...
 
-    def reset(self) -> None:
-        """Called at the start of each episode. Override if the agent has internal state."""
+    def act_batch(self, obs: dict[str, np.ndarray]) -> np.ndarray:
+        """Select one action for each of a batch of observations.
+
+        Used by the batched inference server of soltaire.sim.inference.
+        The default calls act() once per row; agents backed by a model
+        should override it with a single batched call.
+
+        Args:
+            obs: KlondikeEnv observation fields, each with a leading batch
+                axis of the same length.
+
+        Returns:
+            Integer array with one action index per row.
+        """
+        size = len(obs["action_mask"])
+        return np.array(
+            [self.act({name: value[i] for name, value in obs.items()}) for i in range(size)],
+            dtype=np.int64,
+        )
+
+    def reset(self, seed: int | None = None) -> None:
+        """Called at the start of each episode. Override if the agent has internal state.
+
+        Args:
+            seed: Seed for any randomness the agent uses in this episode.
+                The soltaire.sim runner passes the deal number, so a run
+                over a deal range is reproducible.
+        """
         pass
@@ -1,12 +1,126 @@
 """Agent that scores valid actions by heuristics and picks the best each step.
 
-Planned heuristics (highest priority first):
+Heuristics, highest score first:
 
-    1. Move any card to a foundation pile — always preferred.
-    2. Move that exposes a hidden card — increases information and options.
-    3. Move a King to an empty pile, but only if it uncovers a hidden card.
-    4. Any other valid tableau-to-tableau move.
+    1. Move any card to a foundation pile — always preferred. A
+       tableau-to-foundation move that turns up a hidden card also gets
+       the reveal bonus.
+    2. Move that exposes a hidden card — increases information and
+       options. Among these, the pile with the most hidden cards wins.
+    3. Play the waste card to the tableau, or move part of a run to
+       expose a card that can go to its foundation.
+    4. Move a whole face-up run off a pile with no hidden cards, emptying
+       it for a King.
     5. Draw from hand if no better action is available.
+    6. Other partial tableau-to-tableau moves; then moving a whole run
+       with nothing under it onto an empty pile, which only swaps piles
+       (so a King goes to an empty pile only if it uncovers a hidden card);
+       then foundation-to-tableau moves.
+
+Scores are computed without touching Game: a table gives every action id
+its base score, and the tableau-to-tableau block adds bonuses from
+per-action from/to/count tables applied to the observation arrays. A
+whole batch of observations is scored in one pass (score_actions()),
+which act_batch() uses for the vectorized env.
 """
 
-# TODO: implement GreedyAgent(BaseAgent)
+import numpy as np
+
+from soltaire.core.actions import (
+    ACTION_TABLE,
+    DRAW,
+    FOUNDATION_TO_TABLEAU,
+    NUM_ACTIONS,
+    TABLEAU_TO_FOUNDATION,
+    TABLEAU_TO_TABLEAU,
+    WASTE_TO_FOUNDATION,
+    WASTE_TO_TABLEAU,
+)
+from soltaire.core.card import CARDS
+from soltaire.core.game_rules import CAN_FOUNDATION
+from .base import BaseAgent
+
+SCORE_FOUNDATION = 6.0
+SCORE_REVEAL = 5.0
+SCORE_WASTE_TO_TABLEAU = 4.0
+SCORE_EXPOSE_FOUNDATION = 4.0
+SCORE_EMPTY_PILE = 3.0
+SCORE_DRAW = 2.0
+SCORE_PARTIAL_MOVE = 1.0
+SCORE_PILE_SWAP = 0.5
+SCORE_FOUNDATION_TO_TABLEAU = 0.0
+DEPTH_BONUS = 0.01  # per hidden card under a revealing move
+
+# Base score of every action id
+_BASE = np.full(NUM_ACTIONS, SCORE_PARTIAL_MOVE)
+_BASE[DRAW] = SCORE_DRAW
+_BASE[WASTE_TO_FOUNDATION] = SCORE_FOUNDATION
+_BASE[WASTE_TO_TABLEAU:TABLEAU_TO_FOUNDATION] = SCORE_WASTE_TO_TABLEAU
+_BASE[TABLEAU_TO_FOUNDATION:TABLEAU_TO_TABLEAU] = SCORE_FOUNDATION
+_BASE[FOUNDATION_TO_TABLEAU:] = SCORE_FOUNDATION_TO_TABLEAU
+
+# Parameters of the tableau-to-tableau block
+_T2T_ACTIONS = ACTION_TABLE[TABLEAU_TO_TABLEAU:FOUNDATION_TO_TABLEAU]
+_FROM = np.array([action[1] for action in _T2T_ACTIONS])
+_TO = np.array([action[2] for action in _T2T_ACTIONS])
+_COUNT = np.array([action[3] for action in _T2T_ACTIONS])
+
+# Rule tables over tableau observation values: card ids, EMPTY, FACE_DOWN
+_SUIT = np.array([card.suit_index for card in CARDS] + [0, 0])
+_PLAYABLE = np.zeros((54, 14), dtype=bool)
+_PLAYABLE[:52] = np.array(CAN_FOUNDATION).reshape(52, 14)
+
+
+def score_actions(obs: dict[str, np.ndarray]) -> np.ndarray:
+    """Score every action for a batch of KlondikeEnv observations.
+
+    Args:
+        obs: Observation fields with a leading batch axis of length N.
+
+    Returns:
+        (N, NUM_ACTIONS) float array; invalid actions score -inf.
+    """
+    tableau = obs["tableau"]
+    hidden = obs["hidden"].astype(np.intp)
+    heights = obs["foundations"].astype(np.intp)
+    mask = obs["action_mask"]
+    rows = np.arange(len(mask))[:, None]
+
+    visible = (tableau < 52).sum(axis=2)
+    length = hidden + visible
+    scores = np.tile(_BASE, (len(mask), 1))
+
+    # A tableau-to-foundation move of the last face-up card reveals the next one
+    flips = (visible == 1) & (hidden > 0)
+    scores[:, TABLEAU_TO_FOUNDATION:TABLEAU_TO_TABLEAU] += flips * SCORE_REVEAL
+
+    whole = _COUNT == visible[:, _FROM]
+    under = hidden[:, _FROM]
+    exposed = tableau[rows, _FROM, np.maximum(length[:, _FROM] - _COUNT - 1, 0)]
+    playable = _PLAYABLE[exposed, heights[rows, _SUIT[exposed]]] & ~whole
+    empties = whole & (under == 0)
+    onto_empty = length[:, _TO] == 0
+    scores[:, TABLEAU_TO_TABLEAU:FOUNDATION_TO_TABLEAU] = np.select(
+        [whole & (under > 0), playable, empties & onto_empty, empties],
+        [
+            SCORE_REVEAL + under * DEPTH_BONUS,
+            SCORE_EXPOSE_FOUNDATION,
+            SCORE_PILE_SWAP,
+            SCORE_EMPTY_PILE,
+        ],
+        SCORE_PARTIAL_MOVE,
+    )
+
+    scores[~mask] = -np.inf
+    return scores
+
+
+class GreedyAgent(BaseAgent):
+    """Plays the highest-scoring valid action; ties go to the lowest id."""
+
+    def act(self, obs) -> int:
+        batch = {name: value[None] for name, value in obs.items()}
+        return int(score_actions(batch)[0].argmax())
+
+    def act_batch(self, obs: dict[str, np.ndarray]) -> np.ndarray:
+        return score_actions(obs).argmax(axis=1)
@@ -1,16 +1,41 @@
 """Agent that selects a random valid action each step.
 
-Useful as a baseline to compare other agents against.
+Useful as a baseline to compare other agents against. Every action it
+submits is valid: it samples uniformly among the set entries of the
+action mask. act_batch() does this for a whole (N, NUM_ACTIONS) batch of
+masks at once with one uniform draw per row, a cumulative sum and an
+argmax, so the agent costs next to nothing next to the env.
+"""
 
-Implementation notes:
-    - Call env.action_space.sample() to get a random action index.
-    - Filter to valid actions using Game.get_valid_actions() to avoid
-      wasting steps on illegal moves.
+import numpy as np
 
-Game.get_valid_actions() is implemented. Straightforward implementation:
-    - Call env.unwrapped.game.get_valid_actions() to get valid action tuples.
-    - Map tuples to integer indices; use random.choice() to pick one.
-    - This guarantees every submitted action is valid.
-"""
+from .base import BaseAgent
+
+
+def sample_masked(masks: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Pick one set entry of each row of masks, uniformly at random.
+
+    Row i draws k = floor(u * count) for a uniform u and returns the
+    index of its (k + 1)-th set entry: the first column where the running
+    count of set entries exceeds k. Rows with no set entry return 0.
+    """
+    counts = np.cumsum(masks, axis=1, dtype=np.int16)
+    chosen = (rng.random(len(masks)) * counts[:, -1]).astype(counts.dtype)
+    return (counts > chosen[:, None]).argmax(axis=1)
+
+
+class RandomAgent(BaseAgent):
+    """Uniformly random choice among the valid actions."""
+
+    def __init__(self, seed: int | None = None):
+        self.rng = np.random.default_rng(seed)
+
+    def reset(self, seed: int | None = None) -> None:
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+
+    def act(self, obs) -> int:
+        return int(sample_masked(obs["action_mask"][None, :], self.rng)[0])
 
-# TODO: implement RandomAgent(BaseAgent)
+    def act_batch(self, obs: dict[str, np.ndarray]) -> np.ndarray:
+        return sample_masked(obs["action_mask"], self.rng)
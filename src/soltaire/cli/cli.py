@@ -3,11 +3,13 @@
 from rich.console import Console
 
 from soltaire.core.game_logic import Game
+from soltaire.solver import SOLVED, UNSOLVABLE, solve
 
 SUIT_SYMBOLS = {"Hearts": "♥", "Diamonds": "♦", "Clubs": "♣", "Spades": "♠"}
 NUM_LABELS = {1: "A", 11: "J", 12: "Q", 13: "K"}
 SUITS = ["Hearts", "Diamonds", "Clubs", "Spades"]
 SLOT_WIDTH = 4
+HINT_BUDGET_MS = 200  # time the hint search may take
 
 
 class SolitaireCLI:
@@ -139,6 +141,28 @@ class SolitaireCLI:
             return f"tt {from_p} {to_p} {count}  — move {count} card(s) from pile {from_p} ({self._card_label(card)}) → pile {to_p}"
         return str(action)
 
+    def _hint(self) -> tuple | None:
+        """Search for HINT_BUDGET_MS and print the suggested next move, if any.
+
+        The search runs on Game.determinize(), a copy with the cards the
+        player has not seen dealt at random, so the hint uses no more than
+        the player knows.
+        """
+        result = solve(self.game.determinize(), HINT_BUDGET_MS)
+        if not result.moves or result.moves[0] not in self.game.get_valid_actions():
+            return None
+        hint = result.moves[0]
+        if result.status == SOLVED:
+            verdict = "wins if the unseen cards lie as guessed"
+        elif result.status == UNSOLVABLE:
+            verdict = "best try; no win found for a guess of the unseen cards"
+        else:
+            verdict = f"best line after {result.nodes} positions"
+        self.console.print(
+            f"[bold]Hint:[/bold] [green]{self._format_action(hint)}[/green] ({verdict})"
+        )
+        return hint
+
     def _error(self, msg: str) -> None:
         """Print a yellow error message and suppress the next redraw."""
         self.console.print(f"[yellow]{msg}[/yellow]")
@@ -215,6 +239,11 @@ class SolitaireCLI:
             if not actions:
                 self.console.print("[yellow]No valid moves available.[/yellow]")
             else:
+                hint = self._hint()
+                if hint is not None:
+                    # Rank the suggested move first
+                    actions.remove(hint)
+                    actions.insert(0, hint)
                 self.console.print(f"[bold]{len(actions)} valid move(s):[/bold]")
                 for action in actions:
                     self.console.print(f"  [cyan]{self._format_action(action)}[/cyan]")
@@ -5,6 +5,8 @@ __all__ = [
     "Deck",
     "Foundations",
     "Game",
+    "GameBatch",
+    "GameState",
     "Hand",
     "TableauPile",
     "Tableau",
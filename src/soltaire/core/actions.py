@@ -0,0 +1,51 @@
+"""Fixed integer action space for Klondike.
+
+Every action tuple Game understands has a stable integer id, laid out in
+contiguous blocks:
+
+    0           ("draw",)
+    1           ("waste_to_foundation",)
+    2 - 8       ("waste_to_tableau", pile)
+    9 - 15      ("tableau_to_foundation", pile)
+    16 - 561    ("tableau_to_tableau", from, to, count)  # count: 1-13
+    562 - 589   ("foundation_to_tableau", suit, pile)
+"""
+
+from .card import SUITS
+
+MAX_RUN = 13  # a face-up run is at most King down to Ace
+
+DRAW = 0
+WASTE_TO_FOUNDATION = 1
+WASTE_TO_TABLEAU = 2
+TABLEAU_TO_FOUNDATION = WASTE_TO_TABLEAU + 7
+TABLEAU_TO_TABLEAU = TABLEAU_TO_FOUNDATION + 7
+FOUNDATION_TO_TABLEAU = TABLEAU_TO_TABLEAU + 7 * 6 * MAX_RUN
+NUM_ACTIONS = FOUNDATION_TO_TABLEAU + 4 * 7
+
+
+def tableau_to_tableau_id(from_pile: int, to_pile: int, count: int) -> int:
+    """Return the id of ("tableau_to_tableau", from_pile, to_pile, count)."""
+    to_slot = to_pile - 1 if to_pile > from_pile else to_pile
+    return TABLEAU_TO_TABLEAU + (from_pile * 6 + to_slot) * MAX_RUN + count - 1
+
+
+def _build_table() -> tuple[tuple, ...]:
+    table = [("draw",), ("waste_to_foundation",)]
+    table += [("waste_to_tableau", p) for p in range(7)]
+    table += [("tableau_to_foundation", p) for p in range(7)]
+    for from_pile in range(7):
+        for to_pile in range(7):
+            if to_pile == from_pile:
+                continue
+            for count in range(1, MAX_RUN + 1):
+                table.append(("tableau_to_tableau", from_pile, to_pile, count))
+    table += [("foundation_to_tableau", suit, p) for suit in SUITS for p in range(7)]
+    return tuple(table)
+
+
+ACTION_TABLE: tuple[tuple, ...] = _build_table()
+"""Action tuples indexed by action id."""
+
+ACTION_IDS: dict[tuple, int] = {action: i for i, action in enumerate(ACTION_TABLE)}
+"""Inverse of ACTION_TABLE."""
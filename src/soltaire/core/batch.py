@@ -0,0 +1,406 @@
+"""Struct-of-arrays engine that plays many games in lockstep.
+
+GameBatch keeps N positions in numpy arrays laid out like GameState:
+
+    tableau      (N, 7, MAX_PILE) card ids per pile, bottom to top
+    hidden       (N, 7)  face-down cards at the bottom of each pile
+    length       (N, 7)  cards in each pile
+    heights      (N, 4)  foundation heights, in SUITS order
+    talon        (N, 24) waste bottom to top, then the hand top to bottom
+    talon_len    (N,)
+    cursor       (N,)    number of talon cards in the waste
+    no_progress  (N,)    Game._no_progress
+    unseen       (N,)    Game.unseen_mask, bit i for card id i
+
+Empty slots hold EMPTY. valid_action_mask() and step() work on the whole
+batch with the rules of Game, over the integer action space of
+core.actions, so the Python overhead of a move is paid once per batch
+instead of once per game.
+"""
+
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+
+from .actions import (
+    ACTION_TABLE,
+    DRAW,
+    FOUNDATION_TO_TABLEAU,
+    MAX_RUN,
+    NUM_ACTIONS,
+    TABLEAU_TO_FOUNDATION,
+    TABLEAU_TO_TABLEAU,
+    WASTE_TO_FOUNDATION,
+    WASTE_TO_TABLEAU,
+    tableau_to_tableau_id,
+)
+from .card import CARDS, SUIT_INDEX
+from .deal import deal_from_index
+from .game_logic import Game
+from .game_rules import CAN_FOUNDATION, CAN_STACK
+from .state import (
+    CARDS_OFFSET,
+    CURSOR_OFFSET,
+    EMPTY_SLOT,
+    FLAG_NO_PROGRESS,
+    FLAGS_OFFSET,
+    FOUNDATION_OFFSET,
+    HIDDEN_OFFSET,
+    LENGTH_OFFSET,
+    STATE_SIZE,
+    TALON_LENGTH_OFFSET,
+    UNSEEN_OFFSET,
+    UNSEEN_SIZE,
+    GameState,
+)
+from .zobrist import MAX_PILE, MAX_TALON
+
+EMPTY = 52
+"""Card id used for empty slots; every rule table maps it to False."""
+
+# Rule tables extended with a row and column for EMPTY. Placing on EMPTY
+# means placing on an empty pile, which only a King may do.
+_STACK = np.zeros((53, 53), dtype=bool)
+_STACK[:52, :52] = np.array(CAN_STACK).reshape(52, 52)
+_STACK[[card.id for card in CARDS if card.number == 13], EMPTY] = True
+
+_FOUNDATION = np.zeros((53, 14), dtype=bool)
+_FOUNDATION[:52] = np.array(CAN_FOUNDATION).reshape(52, 14)
+
+_SUIT = np.array([card.suit_index for card in CARDS] + [0], dtype=np.intp)
+_NUMBER = np.array([card.number for card in CARDS] + [0], dtype=np.intp)
+_COLOR = np.array([card.color for card in CARDS] + [0], dtype=np.intp)
+# Rank a run's base card needs to go on a pile with this top; 14 for EMPTY
+_TARGET_NUMBER = np.append(_NUMBER[:52], 14)
+
+# Decoded parameters of the tableau-to-tableau and foundation-to-tableau blocks
+_T2T_ACTIONS = ACTION_TABLE[TABLEAU_TO_TABLEAU:FOUNDATION_TO_TABLEAU]
+_T2T_FROM = np.array([action[1] for action in _T2T_ACTIONS])
+_T2T_TO = np.array([action[2] for action in _T2T_ACTIONS])
+_T2T_COUNT = np.array([action[3] for action in _T2T_ACTIONS])
+_F2T_ACTIONS = ACTION_TABLE[FOUNDATION_TO_TABLEAU:]
+_F2T_SUIT = np.array([SUIT_INDEX[action[1]] for action in _F2T_ACTIONS])
+_F2T_PILE = np.array([action[2] for action in _F2T_ACTIONS])
+
+_DIFFERENT_PILES = ~np.eye(7, dtype=bool)
+# _RUN_BASE_ID[from, to] + count is the id of ("tableau_to_tableau", from, to, count)
+_RUN_BASE_ID = np.array(
+    [
+        [tableau_to_tableau_id(f, t, 1) - 1 if f != t else 0 for t in range(7)]
+        for f in range(7)
+    ]
+)
+
+_PILES = np.arange(7)
+# Bit of each card id in an unseen mask; EMPTY gets bit 52, outside every mask
+_BITS = np.left_shift(np.uint64(1), np.arange(53, dtype=np.uint64))
+_TALON_SLOTS = np.arange(MAX_TALON)
+
+
+class GameBatch:
+    """N Klondike games stored as arrays and stepped together."""
+
+    def __init__(self, size: int):
+        """Allocate a batch of size empty positions; see from_deals()."""
+        self.size = size
+        self.tableau = np.full((size, 7, MAX_PILE), EMPTY, dtype=np.uint8)
+        self.hidden = np.zeros((size, 7), dtype=np.intp)
+        self.length = np.zeros((size, 7), dtype=np.intp)
+        self.heights = np.zeros((size, 4), dtype=np.intp)
+        self.talon = np.full((size, MAX_TALON), EMPTY, dtype=np.uint8)
+        self.talon_len = np.zeros(size, dtype=np.intp)
+        self.cursor = np.zeros(size, dtype=np.intp)
+        self.no_progress = np.zeros(size, dtype=bool)
+        self.unseen = np.zeros(size, dtype=np.uint64)
+        self._rows = np.arange(size)
+
+    @classmethod
+    def from_deals(cls, deals: Sequence[int]) -> "GameBatch":
+        """Start one game per deal number (see deal_from_index())."""
+        batch = cls(len(deals))
+        batch.reset(batch._rows, deals)
+        return batch
+
+    @classmethod
+    def from_games(cls, games: Sequence[Game]) -> "GameBatch":
+        """Copy the current positions of games into a new batch."""
+        batch = cls(len(games))
+        for row, game in enumerate(games):
+            batch.load(row, GameState.from_game(game))
+        return batch
+
+    # -- Loading and reading positions ---------------------------------------
+
+    def reset(self, rows: Iterable[int], deals: Iterable[int]) -> None:
+        """Deal a fresh game into each of rows."""
+        for row, deal in zip(rows, deals):
+            cards = deal_from_index(deal)
+            self.tableau[row] = EMPTY
+            for pile in range(7):
+                # Same dealing order as Tableau.initialize_from_cards()
+                dealt = [cards.pop().id for _ in range(pile + 1)]
+                self.tableau[row, pile, : pile + 1] = dealt
+                self.hidden[row, pile] = pile
+                self.length[row, pile] = pile + 1
+            self.heights[row] = 0
+            self.talon[row] = [card.id for card in reversed(cards)]
+            self.talon_len[row] = len(cards)
+            self.cursor[row] = 0
+            self.no_progress[row] = False
+            # Every card but the top of each pile
+            tops = self.tableau[row, _PILES, _PILES]
+            self.unseen[row] = ~np.bitwise_or.reduce(_BITS[tops]) & np.uint64(2**52 - 1)
+
+    def load(self, row: int, state: GameState) -> None:
+        """Overwrite one row with the position in state."""
+        data = np.frombuffer(state.data, dtype=np.uint8)
+        self.hidden[row] = data[HIDDEN_OFFSET : HIDDEN_OFFSET + 7]
+        self.length[row] = data[LENGTH_OFFSET : LENGTH_OFFSET + 7]
+        self.heights[row] = data[FOUNDATION_OFFSET : FOUNDATION_OFFSET + 4]
+        self.tableau[row] = EMPTY
+        pos = CARDS_OFFSET
+        for pile in range(7):
+            length = self.length[row, pile]
+            self.tableau[row, pile, :length] = data[pos : pos + length]
+            pos += length
+        talon_len = data[TALON_LENGTH_OFFSET]
+        self.talon[row] = EMPTY
+        self.talon[row, :talon_len] = data[pos : pos + talon_len]
+        self.talon_len[row] = talon_len
+        self.cursor[row] = data[CURSOR_OFFSET]
+        self.no_progress[row] = bool(data[FLAGS_OFFSET] & FLAG_NO_PROGRESS)
+        self.unseen[row] = int.from_bytes(state.data[UNSEEN_OFFSET:CARDS_OFFSET], "big")
+
+    def state(self, row: int) -> GameState:
+        """Return the position of one row as a GameState."""
+        data = bytearray(STATE_SIZE)
+        data[HIDDEN_OFFSET : HIDDEN_OFFSET + 7] = bytes(self.hidden[row].tolist())
+        data[LENGTH_OFFSET : LENGTH_OFFSET + 7] = bytes(self.length[row].tolist())
+        data[FOUNDATION_OFFSET : FOUNDATION_OFFSET + 4] = bytes(self.heights[row].tolist())
+        data[TALON_LENGTH_OFFSET] = self.talon_len[row]
+        data[CURSOR_OFFSET] = self.cursor[row]
+        data[FLAGS_OFFSET] = FLAG_NO_PROGRESS if self.no_progress[row] else 0
+        unseen = int(self.unseen[row]).to_bytes(UNSEEN_SIZE, "big")
+        data[UNSEEN_OFFSET:CARDS_OFFSET] = unseen
+        card_ids = [
+            self.tableau[row, pile, : self.length[row, pile]] for pile in range(7)
+        ]
+        card_ids.append(self.talon[row, : self.talon_len[row]])
+        cards = np.concatenate(card_ids).tobytes()
+        data[CARDS_OFFSET : CARDS_OFFSET + len(cards)] = cards
+        data[CARDS_OFFSET + len(cards) :] = bytes([EMPTY_SLOT] * (52 - len(cards)))
+        return GameState(bytes(data))
+
+    def to_game(self, row: int) -> Game:
+        """Rebuild one row as a Game."""
+        return self.state(row).to_game()
+
+    def won(self) -> np.ndarray:
+        """Return a bool array marking the games with every card on a foundation."""
+        return (self.heights == 13).all(axis=1)
+
+    # -- Rules ---------------------------------------------------------------
+
+    def _tops(self) -> np.ndarray:
+        """Top card id of every pile, EMPTY for empty piles; shape (N, 7)."""
+        tops = self.tableau[
+            self._rows[:, None], _PILES, np.maximum(self.length - 1, 0)
+        ]
+        return np.where(self.length > 0, tops, EMPTY)
+
+    def _waste_tops(self) -> np.ndarray:
+        """Top waste card of every game, EMPTY if the waste is empty; shape (N,)."""
+        tops = self.talon[self._rows, np.maximum(self.cursor - 1, 0)]
+        return np.where(self.cursor > 0, tops, EMPTY)
+
+    def valid_action_mask(self, out: np.ndarray | None = None) -> np.ndarray:
+        """Fill a (N, NUM_ACTIONS) bool mask; row i equals Game.valid_action_mask().
+
+        Args:
+            out: Optional preallocated bool array of shape (N, NUM_ACTIONS),
+                overwritten in place.
+
+        Returns:
+            The filled mask (out, if given).
+        """
+        if out is None:
+            out = np.empty((self.size, NUM_ACTIONS), dtype=bool)
+        rows = self._rows
+        heights = self.heights
+        tops = self._tops()
+        waste = self._waste_tops()
+        foundation_tops = np.where(
+            heights > 0, np.arange(0, 52, 13) + heights - 1, EMPTY
+        )
+
+        out[:, DRAW] = self.talon_len > 0
+        out[:, WASTE_TO_FOUNDATION] = _FOUNDATION[waste, heights[rows, _SUIT[waste]]]
+        out[:, WASTE_TO_TABLEAU:TABLEAU_TO_FOUNDATION] = _STACK[waste[:, None], tops]
+        out[:, TABLEAU_TO_FOUNDATION:TABLEAU_TO_TABLEAU] = _FOUNDATION[
+            tops, heights[rows[:, None], _SUIT[tops]]
+        ]
+        self._run_moves(tops, out)
+        out[:, FOUNDATION_TO_TABLEAU:] = _STACK[
+            foundation_tops[:, _F2T_SUIT], tops[:, _F2T_PILE]
+        ]
+        return out
+
+    def _run_moves(self, tops: np.ndarray, out: np.ndarray) -> None:
+        """Fill the tableau-to-tableau block of out.
+
+        A face-up run descends one rank at a time in alternating colors,
+        so for each pair of piles at most one count fits: the one whose
+        base card is one rank below the target's top (a King for an empty
+        target). That gives one candidate per pile pair instead of one
+        per run length.
+        """
+        out[:, TABLEAU_TO_TABLEAU:FOUNDATION_TO_TABLEAU] = False
+        visible = self.length - self.hidden
+        from_top = tops[:, :, None]
+        to_top = tops[:, None, :]
+        # Empty targets take a King, i.e. a base card "one below rank 14"
+        counts = _TARGET_NUMBER[to_top] - _NUMBER[from_top]
+        # Colors alternate up the run, so the base color follows from the count
+        base_color = _COLOR[from_top] ^ ((counts - 1) & 1)
+        fits = (
+            (counts >= 1)
+            & (counts <= visible[:, :, None])
+            & ((to_top == EMPTY) | (base_color != _COLOR[to_top]))
+            & _DIFFERENT_PILES
+        )
+        rows, sources, targets = np.nonzero(fits)
+        out[rows, _RUN_BASE_ID[sources, targets] + counts[rows, sources, targets]] = True
+
+    def step(self, actions: Sequence[int] | np.ndarray) -> None:
+        """Apply one action id per game, like Game.apply_legal_id() on every row.
+
+        Actions must be legal (see valid_action_mask()); illegal ids corrupt
+        the rows they are applied to. A negative id leaves that game as is,
+        which lets finished games sit out a step.
+        """
+        actions = np.asarray(actions)
+
+        rows = np.flatnonzero(actions == DRAW)
+        if rows.size:
+            self._draw(rows)
+
+        rows = np.flatnonzero(
+            (actions >= WASTE_TO_FOUNDATION) & (actions < TABLEAU_TO_FOUNDATION)
+        )
+        if rows.size:
+            cards = self._play_waste(rows)
+            to_foundation = actions[rows] == WASTE_TO_FOUNDATION
+            up = rows[to_foundation]
+            self.heights[up, _SUIT[cards[to_foundation]]] += 1
+            down = ~to_foundation
+            self._push(rows[down], actions[rows[down]] - WASTE_TO_TABLEAU, cards[down])
+            self.no_progress[rows] = False
+
+        rows = np.flatnonzero(
+            (actions >= TABLEAU_TO_FOUNDATION) & (actions < TABLEAU_TO_TABLEAU)
+        )
+        if rows.size:
+            piles = actions[rows] - TABLEAU_TO_FOUNDATION
+            self.length[rows, piles] -= 1
+            depth = self.length[rows, piles]
+            cards = self.tableau[rows, piles, depth]
+            self.tableau[rows, piles, depth] = EMPTY
+            self.heights[rows, _SUIT[cards]] += 1
+            self._flip(rows, piles)
+            self.no_progress[rows] = False
+
+        rows = np.flatnonzero(
+            (actions >= TABLEAU_TO_TABLEAU) & (actions < FOUNDATION_TO_TABLEAU)
+        )
+        if rows.size:
+            self._move_runs(rows, actions[rows] - TABLEAU_TO_TABLEAU)
+
+        rows = np.flatnonzero(actions >= FOUNDATION_TO_TABLEAU)
+        if rows.size:
+            index = actions[rows] - FOUNDATION_TO_TABLEAU
+            suits = _F2T_SUIT[index]
+            self.heights[rows, suits] -= 1
+            cards = suits * 13 + self.heights[rows, suits]
+            self._push(rows, _F2T_PILE[index], cards)
+
+    def _draw(self, rows: np.ndarray) -> None:
+        """Draw up to three cards, or recycle an exhausted stock, in each row."""
+        cursor = self.cursor[rows]
+        stock = self.talon_len[rows] - cursor
+
+        recycle = stock == 0
+        self.cursor[rows[recycle]] = 0
+        self.no_progress[rows[recycle]] = True
+
+        # The stock top sits at the cursor; reversing the drawn slots in
+        # place turns them into waste order (see Talon.draw()).
+        rows, cursor, stock = rows[~recycle], cursor[~recycle], stock[~recycle]
+        count = np.minimum(stock, 3)
+        last = cursor + count - 1
+        first_cards = self.talon[rows, cursor]
+        self.talon[rows, cursor] = self.talon[rows, last]
+        self.talon[rows, last] = first_cards
+        self.cursor[rows] = cursor + count
+
+        slots = np.minimum(cursor[:, None] + np.arange(3), MAX_TALON - 1)
+        drawn = np.where(
+            np.arange(3) < count[:, None], self.talon[rows[:, None], slots], EMPTY
+        )
+        self.unseen[rows] &= ~np.bitwise_or.reduce(_BITS[drawn], axis=1)
+
+    def _play_waste(self, rows: np.ndarray) -> np.ndarray:
+        """Remove and return the top waste card of each row."""
+        cursor = self.cursor[rows]
+        cards = self.talon[rows, cursor - 1]
+        # Close the gap by shifting the stock down one slot
+        source = _TALON_SLOTS + (_TALON_SLOTS >= (cursor - 1)[:, None])
+        np.minimum(source, MAX_TALON - 1, out=source)
+        self.talon[rows] = np.take_along_axis(self.talon[rows], source, axis=1)
+        self.talon_len[rows] -= 1
+        self.talon[rows, self.talon_len[rows]] = EMPTY
+        self.cursor[rows] = cursor - 1
+        return cards
+
+    def _push(self, rows: np.ndarray, piles: np.ndarray, cards: np.ndarray) -> None:
+        """Put one card on top of a tableau pile in each row."""
+        self.tableau[rows, piles, self.length[rows, piles]] = cards
+        self.length[rows, piles] += 1
+
+    def _flip(self, rows: np.ndarray, piles: np.ndarray) -> np.ndarray:
+        """Turn up the top hidden card of piles left with no face-up cards.
+
+        Returns a bool array marking the rows where a card was turned.
+        """
+        hidden = self.hidden[rows, piles]
+        flipped = (hidden > 0) & (self.length[rows, piles] == hidden)
+        rows, piles = rows[flipped], piles[flipped]
+        self.hidden[rows, piles] -= 1
+        self.unseen[rows] &= ~_BITS[self.tableau[rows, piles, self.hidden[rows, piles]]]
+        return flipped
+
+    def _move_runs(self, rows: np.ndarray, index: np.ndarray) -> None:
+        """Apply tableau-to-tableau moves; index is relative to TABLEAU_TO_TABLEAU."""
+        sources, targets, counts = _T2T_FROM[index], _T2T_TO[index], _T2T_COUNT[index]
+        start = self.length[rows, sources] - counts
+        base = self.length[rows, targets]
+        for offset in range(MAX_RUN):
+            moving = counts > offset
+            if not moving.any():
+                break
+            r, s = rows[moving], sources[moving]
+            depth = start[moving] + offset
+            cards = self.tableau[r, s, depth]
+            self.tableau[r, targets[moving], base[moving] + offset] = cards
+            self.tableau[r, s, depth] = EMPTY
+        self.length[rows, sources] = start
+        self.length[rows, targets] = base + counts
+
+        flipped = self._flip(rows, sources)
+        self.no_progress[rows[flipped]] = False
+
+        # Exposing a card that can go up counts as progress
+        exposed = ~flipped & (start > 0)
+        r, s = rows[exposed], sources[exposed]
+        tops = self.tableau[r, s, start[exposed] - 1]
+        playable = _FOUNDATION[tops, self.heights[r, _SUIT[tops]]]
+        self.no_progress[r[playable]] = False
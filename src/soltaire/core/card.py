@@ -1,25 +1,77 @@
-"""Card class implementation."""
+"""Card class implementation.
+
+There are exactly 52 Card instances. ``Card(number, suit)`` returns the
+canonical instance from the flyweight table, so equality is an identity
+check and dealing never allocates new cards.
+"""
+
+SUITS = ("Hearts", "Diamonds", "Clubs", "Spades")
+SUIT_INDEX = {suit: i for i, suit in enumerate(SUITS)}
 
 
 class Card:
-    def __init__(self, number, suit):
-        self.number = number
-        self.suit = suit
+    """An interned playing card.
+
+    Attributes:
+        number: Rank, 1 (Ace) to 13 (King).
+        suit: Suit name, one of SUITS.
+        id: Integer id 0-51, ``suit_index * 13 + number - 1``.
+        suit_index: Index of the suit in SUITS.
+        color: 1 for red (Hearts, Diamonds), 0 for black (Clubs, Spades).
+    """
+
+    __slots__ = ("number", "suit", "id", "suit_index", "color")
 
-        if self.number > 13:
+    def __new__(cls, number, suit):
+        if number > 13:
             raise IndexError("Maximum number of card is 13")
 
-        if self.suit not in ("Hearts", "Diamonds", "Clubs", "Spades"):
+        if suit not in SUIT_INDEX:
             raise TypeError(
                 "Suit must be of type: 'Hearts', 'Diamonds', 'Clubs, 'Spades'"
             )
 
+        if number < 1:
+            raise IndexError("Minimum number of card is 1")
+
+        return CARDS[SUIT_INDEX[suit] * 13 + number - 1]
+
+    @classmethod
+    def _make(cls, card_id: int) -> "Card":
+        """Build the canonical instance for a card id (table construction only)."""
+        card = object.__new__(cls)
+        card.id = card_id
+        card.suit_index, rank_index = divmod(card_id, 13)
+        card.number = rank_index + 1
+        card.suit = SUITS[card.suit_index]
+        card.color = 1 if card.suit_index < 2 else 0
+        return card
+
     def __str__(self):
         face_cards = {1: "Ace", 11: "Jack", 12: "Queen", 13: "King"}
         card_value = face_cards.get(self.number, str(self.number))
         return f"{card_value} of {self.suit}"
 
+    def __repr__(self):
+        return f"Card({self.number}, {self.suit!r})"
+
     def __eq__(self, other):
         if not isinstance(other, Card):
             return NotImplemented
-        return self.number == other.number and self.suit == other.suit
+        return self is other
+
+    def __hash__(self):
+        return self.id
+
+    def __reduce__(self):
+        return (Card, (self.number, self.suit))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+CARDS: tuple[Card, ...] = tuple(Card._make(i) for i in range(52))
+"""All 52 canonical cards, indexed by card id."""
@@ -0,0 +1,43 @@
+"""Reproducible deals addressed by deal number.
+
+deal_from_index(n) shuffles the deck with a counter-based generator:
+swap i of the Fisher-Yates shuffle draws from splitmix64(key(n) + i)
+instead of from a shared RNG stream. Any process can deal any game in
+O(52) with no state carried between calls, which is what lets workers
+split a benchmark by deal range and get identical games every run.
+"""
+
+from .card import Card
+from .deck import DECK_ORDER
+
+MAX_DEAL = 1 << 64
+"""Deal numbers run from 0 to MAX_DEAL - 1."""
+
+_MASK = MAX_DEAL - 1
+_GAMMA = 0x9E3779B97F4A7C15
+
+
+def _mix(z: int) -> int:
+    """splitmix64 finalizer."""
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK
+    return z ^ (z >> 31)
+
+
+def deal_from_index(index: int) -> list[Card]:
+    """Return the shuffled deck for deal number index.
+
+    The list is in Deck.cards order: the tableau is dealt by popping from
+    the end and the remaining 24 cards become the hand. The same index
+    always gives the same deal.
+    """
+    if not 0 <= index < MAX_DEAL:
+        raise ValueError(f"Deal number must be between 0 and {MAX_DEAL - 1}")
+
+    key = _mix(index)
+    cards = list(DECK_ORDER)
+    for i in range(51, 0, -1):
+        # 64 random bits modulo at most 52: the bias is below 2**-58
+        j = _mix((key + i * _GAMMA) & _MASK) % (i + 1)
+        cards[i], cards[j] = cards[j], cards[i]
+    return cards
@@ -4,7 +4,11 @@ import random
 
 import pandas as pd
 
-from .card import Card
+from .card import CARDS, SUITS
+
+# Canonical cards in the order Deck.create() has always produced them:
+# all four suits of each number, Aces first.
+DECK_ORDER = tuple(CARDS[s * 13 + n] for n in range(13) for s in range(4))
 
 
 class Deck:
@@ -12,10 +16,7 @@ class Deck:
         self.cards = []
 
     def create(self):
-        suits = ["Hearts", "Diamonds", "Clubs", "Spades"]
-        for i in range(1, 14):
-            for suit in suits:
-                self.cards.append(Card(i, suit))
+        self.cards.extend(DECK_ORDER)
 
     def remove(self, card_to_remove):
         if card_to_remove in self.cards:
@@ -28,7 +29,7 @@ class Deck:
 
     def view_cards(self):
         card_dict = {}
-        for suit in ["Hearts", "Diamonds", "Clubs", "Spades"]:
+        for suit in SUITS:
             num_dict = {str(i): 0 for i in range(1, 14)}
             card_dict[suit] = num_dict
 
@@ -2,12 +2,12 @@
 
 from typing import Dict, Optional
 
-from .card import Card
-from .game_rules import (
-    is_descending,
-    is_different_color,
-    is_valid_foundation_move,
-)
+from .card import SUITS, Card
+from .game_rules import CAN_FOUNDATION, CAN_STACK
+
+
+# Suits of the other color, indexed by Card.color (0 black, 1 red)
+_OPPOSITE_SUITS = (SUITS[:2], SUITS[2:])
 
 
 class InvalidFoundationMoveError(Exception):
@@ -33,6 +33,25 @@ class Foundations:
             "Clubs": [],
             "Spades": [],
         }
+        self._shared: set[str] = set()  # suits whose pile is shared with a clone
+
+    def clone(self) -> "Foundations":
+        """Return copy-on-write foundations sharing these pile lists.
+
+        A pile is copied only when one of the twins first writes to it.
+        """
+        twin = Foundations.__new__(Foundations)
+        twin.piles = dict(self.piles)
+        twin._shared = set(SUITS)
+        self._shared = set(SUITS)
+        return twin
+
+    def _writable_pile(self, suit: str) -> list[Card]:
+        """Return the pile for suit, copying it first if a clone shares it."""
+        if suit in self._shared:
+            self._shared.discard(suit)
+            self.piles[suit] = self.piles[suit].copy()
+        return self.piles[suit]
 
     def can_add_card(self, card: Card) -> bool:
         """Check if a card can be added to its foundation pile.
@@ -42,9 +61,25 @@ class Foundations:
         - Otherwise, card must be same suit and one number higher
         than the current top card
         """
-        pile = self.piles[card.suit]
-        top_card = pile[-1] if pile else None
-        return is_valid_foundation_move(card, top_card)
+        return CAN_FOUNDATION[card.id * 14 + len(self.piles[card.suit])]
+
+    def is_safe_to_add(self, card: Card) -> bool:
+        """Check if a card can go to its foundation without ever hurting.
+
+        Aces and twos are always safe. Any other card is safe once both
+        foundations of the opposite color hold the card one rank lower:
+        then no card is left that could ever be placed on it.
+        """
+        if not self.can_add_card(card):
+            return False
+        if card.number <= 2:
+            return True
+        first, second = _OPPOSITE_SUITS[card.color]
+        piles = self.piles
+        return (
+            len(piles[first]) >= card.number - 1
+            and len(piles[second]) >= card.number - 1
+        )
 
     def add_card_to_foundation(self, card: Card) -> None:
         """Add a card to its foundation pile.
@@ -60,7 +95,14 @@ class Foundations:
                 f"Cannot add {card} to {card.suit} foundation pile"
             )
 
-        self.piles[card.suit].append(card)
+        self._writable_pile(card.suit).append(card)
+
+    def put_card(self, card: Card) -> None:
+        """Add a card to its foundation pile without any rule checks.
+
+        Used by Game for moves that are already known to be legal.
+        """
+        self._writable_pile(card.suit).append(card)
 
     def peek_top_card(self, suit: str) -> Optional[Card]:
         """Look at the top card of a foundation pile without removing it.
@@ -111,10 +153,7 @@ class Foundations:
         if not self.piles[suit]:
             return False
 
-        foundation_card = self.piles[suit][-1]
-        return is_different_color(foundation_card, target_card) and is_descending(
-            foundation_card, target_card
-        )
+        return CAN_STACK[self.piles[suit][-1].id * 52 + target_card.id]
 
     def play_card_from_foundation(self, suit: str, target_card: Card) -> Card:
         """Remove the top card from a foundation pile to play on a target card.
@@ -140,7 +179,14 @@ class Foundations:
                 f"Cannot play {top_card} onto {target_card}"
             )
 
-        return self.piles[suit].pop()
+        return self._writable_pile(suit).pop()
+
+    def take_top_card(self, suit: str) -> Card:
+        """Remove and return the top card of a pile without any rule checks.
+
+        Used by Game to move a card back to the tableau and to undo moves.
+        """
+        return self._writable_pile(suit).pop()
 
     def __str__(self) -> str:
         """Return a string representation of all foundation piles."""
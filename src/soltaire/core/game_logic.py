@@ -1,30 +1,193 @@
 """Core game logic for Solitaire."""
 
-from .deck import Deck
+import random
+from typing import NamedTuple
+
+import numpy as np
+
+from .actions import (
+    ACTION_TABLE,
+    DRAW,
+    FOUNDATION_TO_TABLEAU,
+    MAX_RUN,
+    NUM_ACTIONS,
+    TABLEAU_TO_FOUNDATION,
+    TABLEAU_TO_TABLEAU,
+    WASTE_TO_FOUNDATION,
+    WASTE_TO_TABLEAU,
+)
+from .card import SUITS, Card
+from .deal import MAX_DEAL, deal_from_index
 from .foundations import Foundations
+from .game_rules import CAN_FOUNDATION
 from .hand import Hand
+from .talon import Talon
 from .tableau import Tableau
 from .waste import Waste
+from .zobrist import (
+    FOUNDATION_KEYS,
+    HAND_KEYS,
+    HIDDEN_KEYS,
+    MAX_PILE,
+    TABLEAU_KEYS,
+    WASTE_KEYS,
+    compute_hash,
+)
+
+
+class UndoRecord(NamedTuple):
+    """Everything Game.undo() needs to take back one applied action."""
+
+    action: tuple
+    card: Card | None  # card moved to a foundation, if any
+    flipped: bool  # the move turned a hidden tableau card face up
+    drawn: int  # cards moved from hand to waste by a draw
+    recycled: bool  # the draw recycled the waste back into the hand
+    no_progress: bool
+    state_hash: int
+    unseen: int
 
 
 class Game:
     """Core game logic, independent of any interface."""
 
-    def __init__(self):
-        self.initialize_game()
+    def __init__(self, deal: int | None = None):
+        self.initialize_game(deal)
 
-    def initialize_game(self):
-        """Initialize or reset the game state."""
-        self.deck = Deck()
-        self.deck.create()
-        self.deck.shuffle()
+    def initialize_game(self, deal: int | None = None):
+        """Initialize or reset the game state.
+
+        deal selects a reproducible deal (see deal_from_index()); without
+        it a random deal number is picked. Either way the number is kept
+        in self.deal so the game can be replayed.
+        """
+        if deal is None:
+            deal = random.randrange(MAX_DEAL)
+        self.deal = deal
+        cards = deal_from_index(deal)
 
-        self.waste = Waste()
         self.foundations = Foundations()
         self.tableau = Tableau()
-        self.tableau.initialize_from_deck(self.deck)
-        self.hand = Hand(self.deck.cards.copy())
+        self.tableau.initialize_from_cards(cards)
+        self._set_talon(Talon(stock=cards))
         self._no_progress = False  # True after a full draw cycle with no productive move
+        self.recompute_hash()
+        self.reset_unseen()
+
+    def clone(self) -> "Game":
+        """Return an independent copy of this game for rollouts.
+
+        Zone storage is shared copy-on-write, so forking costs a handful of
+        small objects and each pile is copied only when a move first
+        changes it in either game.
+        """
+        twin = Game.__new__(Game)
+        twin.deal = self.deal
+        twin.foundations = self.foundations.clone()
+        twin.tableau = self.tableau.clone()
+        twin._set_talon(self.talon.clone())
+        twin._no_progress = self._no_progress
+        twin._hash = self._hash
+        twin._unseen = self._unseen
+        return twin
+
+    def _set_talon(self, talon: Talon) -> None:
+        """Install talon as the shared storage behind hand and waste."""
+        self.talon = talon
+        self.hand = Hand.view(talon)
+        self.waste = Waste.view(talon)
+
+    @property
+    def state_hash(self) -> int:
+        """64-bit Zobrist hash of the current position.
+
+        Kept up to date incrementally by draw_cards() and the move_* methods.
+        Call recompute_hash() after editing the zones directly.
+        """
+        return self._hash
+
+    def recompute_hash(self) -> int:
+        """Recompute the Zobrist hash from scratch and return it."""
+        self._hash = compute_hash(self)
+        return self._hash
+
+    @property
+    def unseen_mask(self) -> int:
+        """Bitmask (bit i for card id i) of the cards not yet seen face up.
+
+        These are the tableau's hidden cards plus the stock cards that no
+        draw has turned up yet. Kept up to date by every flip and draw.
+        """
+        return self._unseen
+
+    def reset_unseen(self) -> int:
+        """Mark every hidden tableau card and every stock card unseen; O(52).
+
+        Called on a new deal; GameState keeps the mask of later positions.
+        """
+        unseen = 0
+        for pile in self.tableau.piles:
+            for card in pile.hidden_cards:
+                unseen |= 1 << card.id
+        for card in self.talon.stock_cards():
+            unseen |= 1 << card.id
+        self._unseen = unseen
+        return unseen
+
+    def determinize(self, rng: random.Random | None = None) -> "Game":
+        """Return a copy with the unseen cards dealt at random over their places.
+
+        Every card seen so far stays where it is; the cards of
+        unseen_mask are shuffled over the hidden tableau slots and the
+        stock slots not yet turned up. The result is a perfect-information
+        position consistent with everything observed. Runs in O(unseen)
+        on top of a copy-on-write clone().
+
+        Args:
+            rng: Source of randomness; defaults to the random module.
+        """
+        twin = self.clone()
+        talon = twin.talon
+        piles = twin.tableau.piles
+        hidden = 0
+        cards = []
+        for pile in piles:
+            for card in pile.hidden_cards:
+                hidden |= 1 << card.id
+                cards.append(card)
+        in_stock = self._unseen & ~hidden
+        slots = []
+        while in_stock:
+            low = in_stock & -in_stock
+            card_id = low.bit_length() - 1
+            slots.append(talon.slot_of[card_id])
+            cards.append(talon.slots[slots[-1]])
+            in_stock ^= low
+        if len(cards) < 2:
+            return twin
+
+        dealt = cards.copy()
+        (rng or random).shuffle(dealt)
+        h = twin._hash
+        k = 0
+        for p, pile in enumerate(piles):
+            count = len(pile.hidden_cards)
+            if not count:
+                continue
+            base = p * MAX_PILE
+            for depth in range(count):
+                h ^= TABLEAU_KEYS[(base + depth) * 52 + cards[k + depth].id]
+                h ^= TABLEAU_KEYS[(base + depth) * 52 + dealt[k + depth].id]
+            pile.hidden_cards = dealt[k : k + count]  # a new list; the clone is unaffected
+            k += count
+        if slots:
+            live = talon.live
+            for slot, old, new in zip(slots, cards[k:], dealt[k:]):
+                position = (live >> (slot + 1)).bit_count()  # Hand position from the bottom
+                h ^= HAND_KEYS[position * 52 + old.id] ^ HAND_KEYS[position * 52 + new.id]
+            talon.set_slots(slots, dealt[k:])
+        twin._hash = h
+        return twin
 
     def _mark_productive(self) -> None:
         """Reset stuck state after any progress-making move."""
@@ -32,14 +195,29 @@ class Game:
 
     def draw_cards(self):
         """Draw cards from hand to waste."""
-        cards = self.hand.draw_cards()
+        talon = self.talon
+        waste_base = talon.waste_count
+        cards = talon.draw()
         if cards:
-            self.waste.add_cards(cards)
+            h = self._hash
+            hand_base = talon.stock_count
+            for i, card in enumerate(cards):
+                h ^= HAND_KEYS[(hand_base + i) * 52 + card.id]
+                h ^= WASTE_KEYS[(waste_base + i) * 52 + card.id]
+            self._hash = h
+            for card in cards:
+                self._unseen &= ~(1 << card.id)
             return True
         else:
             self._no_progress = True  # full cycle just completed
-            recycled = self.waste.recycle_to_hand()
-            self.hand.add_cards(recycled)
+            # The hand is empty here, so waste position i becomes hand
+            # position len - 1 - i. Once per stock pass, O(stock size).
+            h = self._hash
+            last = talon.waste_count - 1
+            for i, card in enumerate(talon.waste_cards()):
+                h ^= WASTE_KEYS[i * 52 + card.id] ^ HAND_KEYS[(last - i) * 52 + card.id]
+            self._hash = h
+            talon.recycle()
             return False
 
     def can_move_to_foundation(self, card) -> bool:
@@ -48,84 +226,103 @@ class Game:
 
     def move_waste_to_foundation(self) -> bool:
         """Try to move top waste card to foundation."""
-        if not self.waste.cards:
-            return False
-
-        card = self.waste.peek_top_card()
-        try:
-            if self.foundations.can_add_card(card):
-                self.foundations.add_card_to_foundation(card)
-                self.waste.play_card()
-                self._mark_productive()
-                return True
-        except Exception:
-            pass
-        return False
+        return self._try(("waste_to_foundation",))
 
     def move_waste_to_tableau(self, tableau_pile: int) -> bool:
         """Try to move top waste card to tableau pile."""
-        if not self.waste.cards:
-            return False
-
-        card = self.waste.peek_top_card()
-        try:
-            if self.tableau.can_add_card_to_pile(card, tableau_pile):
-                self.tableau.add_card_to_pile(card, tableau_pile)
-                self.waste.play_card()
-                self._mark_productive()
-                return True
-        except Exception:
-            pass
-        return False
+        return self._try(("waste_to_tableau", tableau_pile))
 
     def move_tableau_to_foundation(self, tableau_pile: int) -> bool:
         """Try to move top card from tableau to foundation."""
-        try:
-            card = self.tableau.get_top_card(tableau_pile)
-            if self.foundations.can_add_card(card):
-                self.foundations.add_card_to_foundation(card)
-                self.tableau.remove_top_card(tableau_pile)
-                self._mark_productive()
-                return True
-        except Exception:
-            pass
-        return False
+        return self._try(("tableau_to_foundation", tableau_pile))
 
     def move_foundation_to_tableau(self, suit: str, tableau_pile: int) -> bool:
         """Try to move the top card of a foundation pile to a tableau pile."""
-        try:
-            card = self.foundations.peek_top_card(suit)
-            if card is None:
-                return False
-            if self.tableau.can_add_card_to_pile(card, tableau_pile):
-                self.foundations.piles[suit].pop()
-                self.tableau.add_card_to_pile(card, tableau_pile)
-                return True
-        except Exception:
-            pass
-        return False
+        return self._try(("foundation_to_tableau", suit, tableau_pile))
 
     def move_tableau_to_tableau(self, from_pile: int, to_pile: int, count: int) -> bool:
         """Try to move cards between tableau piles."""
-        try:
-            pile = self.tableau.piles[from_pile]
-            visible = pile.visible_cards
-            would_reveal_hidden = pile.get_hidden_count() > 0 and count == len(visible)
-            would_expose_foundation = (
-                count < len(visible)
-                and self.foundations.can_add_card(visible[-(count + 1)])
+        return self._try(("tableau_to_tableau", from_pile, to_pile, count))
+
+    def _try(self, action: tuple) -> bool:
+        """Apply action if it is legal; return whether it was applied."""
+        if not self.is_legal(action):
+            return False
+        self.apply_legal(action)
+        return True
+
+    def is_legal(self, action: tuple) -> bool:
+        """Check whether an action tuple can be applied in the current position.
+
+        Drawing is always legal: on an empty hand it recycles the waste.
+        """
+        kind = action[0]
+        piles = self.tableau.piles
+
+        if kind == "draw":
+            return True
+
+        if kind == "waste_to_foundation":
+            card = self.talon.waste_top()
+            return card is not None and self.foundations.can_add_card(card)
+
+        if kind == "waste_to_tableau":
+            card = self.talon.waste_top()
+            return (
+                card is not None
+                and 0 <= action[1] < 7
+                and piles[action[1]].can_add_card(card)
             )
-            cards = self.tableau.get_cards_from_pile(from_pile, count)
-            if self.tableau.can_add_cards_to_pile(cards, to_pile):
-                self.tableau.add_cards_to_pile(cards, to_pile)
-                self.tableau.remove_cards_from_pile(from_pile, count)
-                if would_reveal_hidden or would_expose_foundation:
-                    self._mark_productive()
-                return True
-        except Exception:
-            pass
+
+        if kind == "tableau_to_foundation":
+            if not 0 <= action[1] < 7:
+                return False
+            visible = piles[action[1]].visible_cards
+            return bool(visible) and self.foundations.can_add_card(visible[-1])
+
+        if kind == "tableau_to_tableau":
+            from_pile, to_pile, count = action[1], action[2], action[3]
+            if not (0 <= from_pile < 7 and 0 <= to_pile < 7) or from_pile == to_pile:
+                return False
+            visible = piles[from_pile].visible_cards
+            return 1 <= count <= len(visible) and piles[to_pile].can_add_card(
+                visible[-count]
+            )
+
+        if kind == "foundation_to_tableau":
+            suit, to_pile = action[1], action[2]
+            if suit not in self.foundations.piles or not 0 <= to_pile < 7:
+                return False
+            card = self.foundations.peek_top_card(suit)
+            return card is not None and piles[to_pile].can_add_card(card)
+
         return False
 
+    def autoplay_safe(self) -> list[UndoRecord]:
+        """Play every tableau card that can safely go to a foundation.
+
+        Repeats until no top card passes Foundations.is_safe_to_add(), so
+        cards freed by one play are handled too. Such moves never change
+        whether the game can be won, which lets agents and search skip
+        them as decisions. The waste is left alone: taking a card out of
+        the talon changes which cards later draws turn up.
+
+        Returns:
+            The UndoRecords of the moves played, to undo in reverse order.
+        """
+        records = []
+        piles = self.tableau.piles
+        foundations = self.foundations
+        played = True
+        while played:
+            played = False
+            for i, pile in enumerate(piles):
+                visible = pile.visible_cards
+                if visible and foundations.is_safe_to_add(visible[-1]):
+                    records.append(self.apply_legal(("tableau_to_foundation", i)))
+                    played = True
+        return records
+
     def is_stuck(self) -> bool:
         """Return True if no progress-making action is available.
 
@@ -134,45 +331,50 @@ class Game:
         or playing the current waste card somewhere.  Pure visible-stack shuffling
         and empty draw cycles do not count.
         """
+        foundations = self.foundations.piles
+        needs = self.tableau.needs_index()
+        waste_top = self.talon.waste_top()
+
         # Any immediate foundation move?
         for pile in self.tableau.piles:
-            if pile.visible_cards and self.foundations.can_add_card(pile.visible_cards[-1]):
-                return False
-        if self.waste.cards and self.foundations.can_add_card(self.waste.peek_top_card()):
+            if pile.visible_cards:
+                top = pile.visible_cards[-1]
+                if CAN_FOUNDATION[top.id * 14 + len(foundations[top.suit])]:
+                    return False
+        if waste_top and CAN_FOUNDATION[
+            waste_top.id * 14 + len(foundations[waste_top.suit])
+        ]:
             return False
 
-        # Any tableau move that reveals a hidden card?
-        for i, pile in enumerate(self.tableau.piles):
-            if pile.hidden_cards and pile.visible_cards:
-                for j in range(7):
-                    if j != i and self.tableau.can_add_cards_to_pile(pile.visible_cards, j):
-                        return False
-
-        # Any tableau move that exposes a buried foundationable card?
         for i, pile in enumerate(self.tableau.piles):
             visible = pile.visible_cards
+            others = ~(1 << i)
+
+            # Any tableau move that reveals a hidden card?
+            if pile.hidden_cards and visible:
+                base = visible[0]
+                if needs[base.number * 2 + base.color] & others:
+                    return False
+
+            # Any tableau move that exposes a buried foundationable card?
             for count in range(1, len(visible)):  # partial stack moves only
                 new_top = visible[-(count + 1)]
-                if self.foundations.can_add_card(new_top):
-                    cards_to_move = visible[-count:]
-                    for j in range(7):
-                        if j != i and self.tableau.can_add_cards_to_pile(cards_to_move, j):
-                            return False
+                if CAN_FOUNDATION[new_top.id * 14 + len(foundations[new_top.suit])]:
+                    base = visible[-count]
+                    if needs[base.number * 2 + base.color] & others:
+                        return False
 
         # Any waste card playable to tableau?
-        if self.waste.cards:
-            card = self.waste.peek_top_card()
-            for i in range(7):
-                if self.tableau.can_add_card_to_pile(card, i):
-                    return False
+        if waste_top and needs[waste_top.number * 2 + waste_top.color]:
+            return False
 
         # Hand + waste empty → definitely stuck
-        if not self.hand.cards and not self.waste.cards:
+        if not self.talon.stock_count and not self.talon.waste_count:
             return True
 
         # Grace period: waste was just recycled back to hand.
         # The new cycle hasn't been drawn yet, so we can't judge it yet.
-        if not self.waste.cards:
+        if not self.talon.waste_count:
             return False
 
         return self._no_progress
@@ -188,33 +390,271 @@ class Game:
             ("tableau_to_tableau", from, to, count)
         """
         actions = []
+        needs = self.tableau.needs_index()
 
-        if self.hand.cards or self.waste.cards:
+        if self.talon.stock_count or self.talon.waste_count:
             actions.append(("draw",))
 
-        if self.waste.cards:
-            card = self.waste.peek_top_card()
+        card = self.talon.waste_top()
+        if card is not None:
             if self.foundations.can_add_card(card):
                 actions.append(("waste_to_foundation",))
-            for i in range(7):
-                if self.tableau.can_add_card_to_pile(card, i):
-                    actions.append(("waste_to_tableau", i))
+            targets = needs[card.number * 2 + card.color]
+            while targets:
+                low = targets & -targets
+                actions.append(("waste_to_tableau", low.bit_length() - 1))
+                targets ^= low
 
-        for from_pile in range(7):
-            pile = self.tableau.piles[from_pile]
-            visible = pile.get_visible_cards()
+        for from_pile, pile in enumerate(self.tableau.piles):
+            visible = pile.visible_cards
             if not visible:
                 continue
 
             if self.foundations.can_add_card(visible[-1]):
                 actions.append(("tableau_to_foundation", from_pile))
 
-            for count in range(1, len(visible) + 1):
-                cards = self.tableau.get_cards_from_pile(from_pile, count)
-                for to_pile in range(7):
-                    if to_pile == from_pile:
-                        continue
-                    if self.tableau.can_add_cards_to_pile(cards, to_pile):
-                        actions.append(("tableau_to_tableau", from_pile, to_pile, count))
+            for count, to_pile in self._run_moves(from_pile, visible):
+                actions.append(("tableau_to_tableau", from_pile, to_pile, count))
 
         return actions
+
+    def _run_moves(self, from_pile: int, visible: list[Card]) -> list[tuple[int, int]]:
+        """Return the (count, to_pile) tableau moves off a pile, sorted.
+
+        A face-up run descends one rank at a time in alternating colors,
+        so for each target at most one count fits: the one whose base card
+        is one rank below the target's top (a King for an empty target).
+        GameBatch._run_moves() uses the same rule.
+        """
+        top = visible[-1]
+        size = len(visible)
+        moves = []
+        for to_pile, target in enumerate(self.tableau.piles):
+            cards = target.visible_cards
+            if cards:
+                under = cards[-1]
+                count = under.number - top.number
+                # Colors alternate up the run, so the base color follows from count
+                if top.color ^ ((count - 1) & 1) == under.color:
+                    continue
+            else:
+                count = 14 - top.number
+            if 0 < count <= size and to_pile != from_pile:
+                moves.append((count, to_pile))
+        moves.sort()
+        return moves
+
+    def valid_action_mask(self, out: np.ndarray | None = None) -> np.ndarray:
+        """Fill a boolean mask over the integer action space (see core.actions).
+
+        The set bits are exactly the ids of get_valid_actions(), plus every
+        legal ("foundation_to_tableau", suit, pile) move.
+
+        Args:
+            out: Optional preallocated bool array of length NUM_ACTIONS,
+                overwritten in place.
+
+        Returns:
+            The filled mask (out, if given).
+        """
+        if out is None:
+            out = np.zeros(NUM_ACTIONS, dtype=bool)
+        else:
+            out.fill(False)
+        needs = self.tableau.needs_index()
+
+        if self.talon.stock_count or self.talon.waste_count:
+            out[DRAW] = True
+
+        card = self.talon.waste_top()
+        if card is not None:
+            if self.foundations.can_add_card(card):
+                out[WASTE_TO_FOUNDATION] = True
+            targets = needs[card.number * 2 + card.color]
+            while targets:
+                low = targets & -targets
+                out[WASTE_TO_TABLEAU + low.bit_length() - 1] = True
+                targets ^= low
+
+        for from_pile, pile in enumerate(self.tableau.piles):
+            visible = pile.visible_cards
+            if not visible:
+                continue
+
+            if self.foundations.can_add_card(visible[-1]):
+                out[TABLEAU_TO_FOUNDATION + from_pile] = True
+
+            for count, to_pile in self._run_moves(from_pile, visible):
+                to_slot = to_pile - 1 if to_pile > from_pile else to_pile
+                out[
+                    TABLEAU_TO_TABLEAU + (from_pile * 6 + to_slot) * MAX_RUN + count - 1
+                ] = True
+
+        for suit_index, suit in enumerate(SUITS):
+            pile = self.foundations.piles[suit]
+            if not pile:
+                continue
+            card = pile[-1]
+            targets = needs[card.number * 2 + card.color]
+            while targets:
+                low = targets & -targets
+                out[FOUNDATION_TO_TABLEAU + suit_index * 7 + low.bit_length() - 1] = True
+                targets ^= low
+
+        return out
+
+    def apply_action_id(self, action_id: int) -> UndoRecord:
+        """Apply an action by its integer id; see apply()."""
+        return self.apply(ACTION_TABLE[action_id])
+
+    def apply_legal_id(self, action_id: int) -> UndoRecord:
+        """Apply a legal action by its integer id; see apply_legal()."""
+        return self.apply_legal(ACTION_TABLE[action_id])
+
+    def apply(self, action: tuple) -> UndoRecord:
+        """Apply an action tuple and return a record that undoes it.
+
+        Accepts every form produced by get_valid_actions(), plus
+        ("foundation_to_tableau", suit, pile).
+
+        Raises:
+            ValueError: If the action is not legal in the current position.
+        """
+        if not self.is_legal(action):
+            raise ValueError(f"Illegal action: {action}")
+        return self.apply_legal(action)
+
+    def apply_legal(self, action: tuple) -> UndoRecord:
+        """Apply an action known to be legal, skipping every rule check.
+
+        Meant for search and agent loops that feed back actions from
+        get_valid_actions() or valid_action_mask(). Passing an illegal
+        action corrupts the game; use apply() when in doubt.
+        """
+        kind = action[0]
+        no_progress, state_hash, unseen = self._no_progress, self._hash, self._unseen
+        piles = self.tableau.piles
+        card = None
+        flipped = False
+        drawn = 0
+        recycled = False
+
+        if kind == "draw":
+            drawn = min(3, self.talon.stock_count)
+            recycled = not self.draw_cards()
+
+        elif kind == "waste_to_foundation":
+            card = self.talon.play()
+            self.foundations.put_card(card)
+            self._hash ^= (
+                WASTE_KEYS[self.talon.waste_count * 52 + card.id] ^ FOUNDATION_KEYS[card.id]
+            )
+            self._mark_productive()
+
+        elif kind == "waste_to_tableau":
+            moved = self.talon.play()
+            pile = piles[action[1]]
+            depth = len(pile.hidden_cards) + len(pile.visible_cards)
+            pile.restore_cards([moved])
+            self._hash ^= (
+                WASTE_KEYS[self.talon.waste_count * 52 + moved.id]
+                ^ TABLEAU_KEYS[(action[1] * MAX_PILE + depth) * 52 + moved.id]
+            )
+            self._mark_productive()
+
+        elif kind == "tableau_to_foundation":
+            pile_index = action[1]
+            pile = piles[pile_index]
+            hidden = len(pile.hidden_cards)
+            depth = hidden + len(pile.visible_cards) - 1
+            card = pile.take_cards(1)[0]
+            self.foundations.put_card(card)
+            h = self._hash
+            h ^= TABLEAU_KEYS[(pile_index * MAX_PILE + depth) * 52 + card.id]
+            h ^= FOUNDATION_KEYS[card.id]
+            if not pile.visible_cards and hidden:
+                pile.reveal_top_card()
+                flipped = True
+                self._unseen &= ~(1 << pile.visible_cards[-1].id)
+                h ^= HIDDEN_KEYS[pile_index * 7 + hidden]
+                h ^= HIDDEN_KEYS[pile_index * 7 + hidden - 1]
+            self._hash = h
+            self._mark_productive()
+
+        elif kind == "tableau_to_tableau":
+            from_pile, to_pile, count = action[1], action[2], action[3]
+            source, target = piles[from_pile], piles[to_pile]
+            hidden = len(source.hidden_cards)
+            from_depth = hidden + len(source.visible_cards) - count
+            to_depth = len(target.hidden_cards) + len(target.visible_cards)
+            cards = source.take_cards(count)
+            target.restore_cards(cards)
+            h = self._hash
+            from_base = from_pile * MAX_PILE + from_depth
+            to_base = to_pile * MAX_PILE + to_depth
+            for offset, moved in enumerate(cards):
+                h ^= TABLEAU_KEYS[(from_base + offset) * 52 + moved.id]
+                h ^= TABLEAU_KEYS[(to_base + offset) * 52 + moved.id]
+            if source.visible_cards:
+                # Exposing a card that can go up counts as progress
+                if self.foundations.can_add_card(source.visible_cards[-1]):
+                    self._mark_productive()
+            elif hidden:
+                source.reveal_top_card()
+                flipped = True
+                self._unseen &= ~(1 << source.visible_cards[-1].id)
+                h ^= HIDDEN_KEYS[from_pile * 7 + hidden]
+                h ^= HIDDEN_KEYS[from_pile * 7 + hidden - 1]
+                self._mark_productive()
+            self._hash = h
+
+        elif kind == "foundation_to_tableau":
+            moved = self.foundations.take_top_card(action[1])
+            pile = piles[action[2]]
+            depth = len(pile.hidden_cards) + len(pile.visible_cards)
+            pile.restore_cards([moved])
+            self._hash ^= (
+                FOUNDATION_KEYS[moved.id]
+                ^ TABLEAU_KEYS[(action[2] * MAX_PILE + depth) * 52 + moved.id]
+            )
+
+        return UndoRecord(
+            action, card, flipped, drawn, recycled, no_progress, state_hash, unseen
+        )
+
+    def undo(self, record: UndoRecord) -> None:
+        """Take back the action that produced record.
+
+        Records must be undone in reverse order of application.
+        """
+        action = record.action
+        kind = action[0]
+        piles = self.tableau.piles
+
+        if kind == "draw":
+            if record.recycled:
+                self.talon.unrecycle()
+            else:
+                self.talon.undraw(record.drawn)
+        elif kind == "waste_to_foundation":
+            self.talon.unplay(self.foundations.take_top_card(record.card.suit))
+        elif kind == "waste_to_tableau":
+            self.talon.unplay(piles[action[1]].take_cards(1)[0])
+        elif kind == "tableau_to_foundation":
+            self.foundations.take_top_card(record.card.suit)
+            pile = piles[action[1]]
+            if record.flipped:
+                pile.hide_top_card()
+            pile.restore_cards([record.card])
+        elif kind == "tableau_to_tableau":
+            cards = piles[action[2]].take_cards(action[3])
+            pile = piles[action[1]]
+            if record.flipped:
+                pile.hide_top_card()
+            pile.restore_cards(cards)
+        elif kind == "foundation_to_tableau":
+            self.foundations.put_card(piles[action[2]].take_cards(1)[0])
+
+        self._no_progress = record.no_progress
+        self._hash = record.state_hash
+        self._unseen = record.unseen
@@ -1,6 +1,23 @@
 """Common rules and validations for Solitaire card movements."""
 
-from .card import Card
+from .card import CARDS, Card
+
+RED_SUITS = frozenset(("Hearts", "Diamonds"))
+
+# Lookup tables indexed by card id. Both are built once at import time so
+# legality checks in the hot paths are a single tuple index.
+
+CAN_STACK: tuple[bool, ...] = tuple(
+    moving.color != target.color and moving.number == target.number - 1
+    for moving in CARDS
+    for target in CARDS
+)
+"""CAN_STACK[moving.id * 52 + target.id]: moving may be placed on target in the tableau."""
+
+CAN_FOUNDATION: tuple[bool, ...] = tuple(
+    card.number == height + 1 for card in CARDS for height in range(14)
+)
+"""CAN_FOUNDATION[card.id * 14 + h]: card may go on its suit's foundation of height h."""
 
 
 def is_red_suit(suit: str) -> bool:
@@ -12,7 +29,7 @@ def is_red_suit(suit: str) -> bool:
     Returns:
         True if the suit is Hearts or Diamonds, False otherwise.
     """
-    return suit in ["Hearts", "Diamonds"]
+    return suit in RED_SUITS
 
 
 def is_different_color(card1: Card, card2: Card) -> bool:
@@ -28,7 +45,7 @@ def is_different_color(card1: Card, card2: Card) -> bool:
     Returns:
         True if the cards are of different colors.
     """
-    return is_red_suit(card1.suit) != is_red_suit(card2.suit)
+    return card1.color != card2.color
 
 
 def is_descending(bottom_card: Card, top_card: Card) -> bool:
@@ -77,9 +94,7 @@ def is_valid_tableau_move(moving_card: Card, target_card: Card) -> bool:
     Returns:
         True if the move is valid according to Solitaire rules.
     """
-    return is_different_color(moving_card, target_card) and is_descending(
-        moving_card, target_card
-    )
+    return CAN_STACK[moving_card.id * 52 + target_card.id]
 
 
 def is_valid_foundation_move(
@@ -1,6 +1,7 @@
 """Implementation of the Solitaire hand (draw pile)."""
 
 from .card import Card
+from .talon import Talon
 
 
 class Hand:
@@ -8,11 +9,30 @@ class Hand:
 
     The hand is where cards are drawn from. When the hand is empty,
     cards from the waste can be recycled back into the hand.
+
+    A hand is a view of the stock part of a Talon. A Game's hand and waste
+    share one talon, so drawing and recycling never copy card lists.
     """
 
     def __init__(self, cards: list[Card]):
-        """Initialize the hand with a list of cards."""
-        self.cards = cards
+        """Initialize the hand with a list of cards (top card last)."""
+        self.talon = Talon(stock=cards)
+
+    @classmethod
+    def view(cls, talon: Talon) -> "Hand":
+        """Return a hand that reads and writes the stock of talon."""
+        hand = cls.__new__(cls)
+        hand.talon = talon
+        return hand
+
+    @property
+    def cards(self) -> list[Card]:
+        """The cards in the hand as a new list, top card last."""
+        return self.talon.stock_cards()
+
+    @cards.setter
+    def cards(self, cards: list[Card]) -> None:
+        self.talon.set_stock(cards)
 
     def draw_cards(self, count: int = 3) -> list[Card]:
         """Draw up to count cards from the hand.
@@ -20,24 +40,16 @@ class Hand:
         Returns fewer than count cards if there aren't enough cards left.
         Returns an empty list if the hand is empty.
         """
-        if not self.cards:
-            return []
-
-        # Draw up to count cards or all remaining cards
-        num_cards = min(count, len(self.cards))
-        drawn_cards = self.cards[-num_cards:]
-        self.cards = self.cards[:-num_cards]
-
-        return drawn_cards
+        return self.talon.draw(count)
 
     def add_cards(self, cards: list[Card]) -> None:
         """Add cards to the hand (used when recycling from waste)."""
         # In Solitaire, when recycling cards they go to the bottom of the hand
-        self.cards = cards + self.cards
+        self.talon.add_to_stock_bottom(cards)
 
     def is_empty(self) -> bool:
         """Check if the hand is empty."""
-        return len(self.cards) == 0
+        return self.talon.stock_count == 0
 
     def __str__(self) -> str:
-        return f"Hand: {len(self.cards)} cards"
+        return f"Hand: {self.talon.stock_count} cards"
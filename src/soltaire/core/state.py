@@ -0,0 +1,138 @@
+"""Compact, fixed-size encoding of a Klondike position."""
+
+from .card import CARDS, SUITS
+from .foundations import Foundations
+from .game_logic import Game
+from .tableau import Tableau, TableauPile
+from .talon import Talon
+
+# Byte layout of GameState.data:
+#   [0:7]    hidden-card count of each tableau pile
+#   [7:14]   total card count of each tableau pile
+#   [14:18]  foundation heights, in SUITS order
+#   [18]     talon length (waste + hand)
+#   [19]     stock/waste cursor: number of talon cards in the waste
+#   [20]     flags (bit 0: no-progress flag used by Game.is_stuck)
+#   [21:28]  Game.unseen_mask, big-endian (bit i set: card id i unseen)
+#   [28:80]  card ids: tableau piles bottom to top, then the talon,
+#            padded with EMPTY_SLOT
+HIDDEN_OFFSET = 0
+LENGTH_OFFSET = 7
+FOUNDATION_OFFSET = 14
+TALON_LENGTH_OFFSET = 18
+CURSOR_OFFSET = 19
+FLAGS_OFFSET = 20
+UNSEEN_OFFSET = 21
+UNSEEN_SIZE = 7
+CARDS_OFFSET = UNSEEN_OFFSET + UNSEEN_SIZE
+STATE_SIZE = CARDS_OFFSET + 52
+
+EMPTY_SLOT = 0xFF
+FLAG_NO_PROGRESS = 0x01
+
+
+class GameState:
+    """An immutable snapshot of a Game packed into STATE_SIZE bytes.
+
+    Tableau piles are stored as card ids from bottom to top together with
+    their hidden-card count. Foundations only need their heights, since
+    each one holds a run starting from the Ace. The hand and waste share
+    one talon sequence ``waste.cards + reversed(hand.cards)`` and a cursor
+    marking where the waste ends, so the top of the hand sits right after
+    the top of the waste. The unseen mask is kept too, so a restored
+    game knows which cards it has already seen.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes):
+        if len(data) != STATE_SIZE:
+            raise ValueError(f"GameState data must be {STATE_SIZE} bytes")
+        self.data = bytes(data)
+
+    @classmethod
+    def from_game(cls, game: Game) -> "GameState":
+        """Encode the current position of a Game."""
+        data = bytearray(STATE_SIZE)
+        card_ids = []
+
+        for i, pile in enumerate(game.tableau.piles):
+            data[HIDDEN_OFFSET + i] = len(pile.hidden_cards)
+            data[LENGTH_OFFSET + i] = len(pile.hidden_cards) + len(pile.visible_cards)
+            card_ids.extend(card.id for card in pile.hidden_cards)
+            card_ids.extend(card.id for card in pile.visible_cards)
+
+        for i, suit in enumerate(SUITS):
+            data[FOUNDATION_OFFSET + i] = len(game.foundations.piles[suit])
+
+        waste, hand = game.waste.cards, game.hand.cards
+        data[TALON_LENGTH_OFFSET] = len(waste) + len(hand)
+        data[CURSOR_OFFSET] = len(waste)
+        card_ids.extend(card.id for card in waste)
+        card_ids.extend(card.id for card in reversed(hand))
+
+        data[FLAGS_OFFSET] = FLAG_NO_PROGRESS if game._no_progress else 0
+        data[UNSEEN_OFFSET:CARDS_OFFSET] = game.unseen_mask.to_bytes(UNSEEN_SIZE, "big")
+        data[CARDS_OFFSET : CARDS_OFFSET + len(card_ids)] = bytes(card_ids)
+        data[CARDS_OFFSET + len(card_ids) :] = bytes(
+            [EMPTY_SLOT] * (52 - len(card_ids))
+        )
+        return cls(bytes(data))
+
+    def to_game(self) -> Game:
+        """Rebuild an equivalent Game from this snapshot."""
+        data = self.data
+        pos = CARDS_OFFSET
+
+        tableau = Tableau()
+        for i in range(7):
+            hidden = data[HIDDEN_OFFSET + i]
+            length = data[LENGTH_OFFSET + i]
+            cards = [CARDS[card_id] for card_id in data[pos : pos + length]]
+            pos += length
+            pile = TableauPile([])
+            pile.hidden_cards = cards[:hidden]
+            pile.visible_cards = cards[hidden:]
+            tableau.piles[i] = pile
+
+        foundations = Foundations()
+        for i, suit in enumerate(SUITS):
+            height = data[FOUNDATION_OFFSET + i]
+            foundations.piles[suit] = list(CARDS[i * 13 : i * 13 + height])
+
+        talon_length = data[TALON_LENGTH_OFFSET]
+        cursor = data[CURSOR_OFFSET]
+        talon = [CARDS[card_id] for card_id in data[pos : pos + talon_length]]
+
+        game = Game.__new__(Game)
+        game.deal = None
+        game.foundations = foundations
+        game.tableau = tableau
+        game._set_talon(Talon(stock=talon[cursor:][::-1], waste=talon[:cursor]))
+        game._no_progress = bool(data[FLAGS_OFFSET] & FLAG_NO_PROGRESS)
+        game.recompute_hash()
+        game._unseen = int.from_bytes(data[UNSEEN_OFFSET:CARDS_OFFSET], "big")
+        return game
+
+    def to_int(self) -> int:
+        """Return the snapshot as a single non-negative integer."""
+        return int.from_bytes(self.data, "big")
+
+    @classmethod
+    def from_int(cls, value: int) -> "GameState":
+        """Inverse of to_int()."""
+        return cls(value.to_bytes(STATE_SIZE, "big"))
+
+    def __bytes__(self) -> bytes:
+        return self.data
+
+    def __eq__(self, other):
+        if not isinstance(other, GameState):
+            return NotImplemented
+        return self.data == other.data
+
+    def __hash__(self):
+        return hash(self.data)
+
+    def __repr__(self) -> str:
+        return f"GameState({self.data.hex()})"
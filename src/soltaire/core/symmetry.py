@@ -0,0 +1,50 @@
+"""Symmetry-canonical position keys.
+
+The rules never tell the two red suits apart, nor the two black suits,
+and the seven tableau piles are interchangeable. Positions that differ
+only by such a relabeling are equivalent for search, so a cache keyed on
+canonical_key() stores each class of them once instead of up to
+4 * 7! times.
+"""
+
+from .card import CARDS, SUITS
+
+# Suit permutations that keep colors: identity, swap the red suits, swap
+# the black suits, swap both. Each one is its own inverse.
+_SUIT_PERMUTATIONS = ((0, 1, 2, 3), (1, 0, 2, 3), (0, 1, 3, 2), (1, 0, 3, 2))
+
+# Card id mapping for each permutation
+_CARD_MAPS = tuple(
+    tuple(perm[card.suit_index] * 13 + card.number - 1 for card in CARDS)
+    for perm in _SUIT_PERMUTATIONS
+)
+
+
+def canonical_key(game) -> int:
+    """Return a key for game's position; equivalent positions share a key.
+
+    The position is relabeled with each color-preserving suit permutation,
+    tableau piles are sorted, and the smallest result is hashed, so
+    inequivalent positions get different keys up to hash collisions.
+    Unlike Game.state_hash this is O(52) per call.
+    """
+    piles = [
+        (len(pile.hidden_cards), [c.id for c in pile.hidden_cards + pile.visible_cards])
+        for pile in game.tableau.piles
+    ]
+    talon = [card.id for card in game.talon.waste_cards()]
+    talon += [card.id for card in reversed(game.talon.stock_cards())]
+    heights = [len(game.foundations.piles[suit]) for suit in SUITS]
+
+    best = None
+    for perm, card_map in zip(_SUIT_PERMUTATIONS, _CARD_MAPS):
+        form = (
+            tuple(heights[perm[s]] for s in range(4)),
+            tuple(
+                sorted((hidden, tuple(card_map[i] for i in ids)) for hidden, ids in piles)
+            ),
+            tuple(card_map[i] for i in talon),
+        )
+        if best is None or form < best:
+            best = form
+    return hash((best, game.talon.waste_count))
@@ -1,6 +1,14 @@
 """Implementation of the Solitaire tableau piles."""
 
 from .card import Card
+from .game_rules import CAN_STACK
+
+# Index into Tableau.needs_index() for the card a pile accepts:
+# number * 2 + color. Empty piles accept Kings of either color.
+NEEDS_SIZE = 14 * 2
+_ALL_PILES = (1 << 7) - 1
+# Index of seven empty piles
+_EMPTY_NEEDS = (0,) * 26 + (_ALL_PILES, _ALL_PILES)
 
 
 class TableauPile:
@@ -13,12 +21,30 @@ class TableauPile:
     def __init__(self, initial_cards: list[Card]):
         self.visible_cards: list[Card] = []  # Cards that are face up
         self.hidden_cards: list[Card] = []  # Cards that are face down
+        self._shared = False  # Card lists are shared with a clone; copy before writing
 
         # Last card should be visible, rest hidden
         if initial_cards:
             self.hidden_cards = initial_cards[:-1]
             self.visible_cards = [initial_cards[-1]]
 
+    def clone(self) -> "TableauPile":
+        """Return a copy-on-write twin that shares this pile's card lists.
+
+        Whichever pile is written to first copies the lists at that point.
+        """
+        twin = TableauPile.__new__(TableauPile)
+        twin.visible_cards = self.visible_cards
+        twin.hidden_cards = self.hidden_cards
+        twin._shared = self._shared = True
+        return twin
+
+    def _unshare(self) -> None:
+        """Take private copies of card lists shared with a clone."""
+        self.visible_cards = self.visible_cards.copy()
+        self.hidden_cards = self.hidden_cards.copy()
+        self._shared = False
+
     def can_add_card(self, card: Card) -> bool:
         """Check if a card can be added to this pile.
 
@@ -29,18 +55,7 @@ class TableauPile:
             # Only Kings (13) can be placed on empty piles
             return card.number == 13
 
-        top_card = self.visible_cards[-1]
-
-        # Check for alternating colors (Hearts/Diamonds are red, Clubs/Spades are black)
-        def is_red_suit(suit: str) -> bool:
-            return suit in ["Hearts", "Diamonds"]
-
-        is_different_color = is_red_suit(card.suit) != is_red_suit(top_card.suit)
-
-        # Check for descending order
-        is_descending = card.number == top_card.number - 1
-
-        return is_different_color and is_descending
+        return CAN_STACK[card.id * 52 + self.visible_cards[-1].id]
 
     def add_cards(self, cards: list[Card]) -> bool:
         """Add one or more cards to the visible pile."""
@@ -51,6 +66,8 @@ class TableauPile:
         if not self.can_add_card(cards[0]):
             return False
 
+        if self._shared:
+            self._unshare()
         self.visible_cards.extend(cards)
         return True
 
@@ -59,6 +76,8 @@ class TableauPile:
         if not self.visible_cards:
             if not self.hidden_cards:
                 raise ValueError("No cards in pile")
+            if self._shared:
+                self._unshare()
             # Flip the top hidden card
             self.visible_cards.append(self.hidden_cards.pop())
 
@@ -66,6 +85,8 @@ class TableauPile:
 
     def remove_top_card(self) -> Card:
         """Remove and return the top card."""
+        if self._shared:
+            self._unshare()
         if not self.visible_cards:
             if not self.hidden_cards:
                 raise ValueError("No cards in pile")
@@ -86,6 +107,8 @@ class TableauPile:
         if count > len(self.visible_cards):
             raise ValueError("Not enough visible cards")
 
+        if self._shared:
+            self._unshare()
         removed_cards = self.visible_cards[-count:]
         self.visible_cards = self.visible_cards[:-count]
 
@@ -96,6 +119,38 @@ class TableauPile:
 
         return removed_cards
 
+    def take_cards(self, count: int) -> list[Card]:
+        """Remove the top count visible cards without flipping a hidden card.
+
+        Used to undo a move onto this pile.
+        """
+        if self._shared:
+            self._unshare()
+        cards = self.visible_cards[-count:]
+        del self.visible_cards[-count:]
+        return cards
+
+    def restore_cards(self, cards: list[Card]) -> None:
+        """Put cards back on top of the visible pile without validation.
+
+        Used to undo a move off this pile.
+        """
+        if self._shared:
+            self._unshare()
+        self.visible_cards.extend(cards)
+
+    def reveal_top_card(self) -> None:
+        """Turn the top hidden card face up without any checks."""
+        if self._shared:
+            self._unshare()
+        self.visible_cards.append(self.hidden_cards.pop())
+
+    def hide_top_card(self) -> None:
+        """Turn the only visible card face down again (undo of a flip)."""
+        if self._shared:
+            self._unshare()
+        self.hidden_cards.append(self.visible_cards.pop())
+
     def get_visible_cards(self) -> list[Card]:
         """Return the visible cards in this pile."""
         return self.visible_cards.copy()
@@ -116,6 +171,49 @@ class Tableau:
     def __init__(self):
         # Initialize Tableau with 7 empty piles
         self.piles: list[TableauPile] = [TableauPile([]) for _ in range(7)]
+        self._needs = list(_EMPTY_NEEDS)
+        self._tops: list[Card | None] = [None] * 7  # top card needs_index() last saw
+
+    def clone(self) -> "Tableau":
+        """Return a tableau whose piles are copy-on-write twins of these."""
+        twin = Tableau.__new__(Tableau)
+        twin.piles = [pile.clone() for pile in self.piles]
+        twin._needs = self._needs.copy()
+        twin._tops = self._tops.copy()
+        return twin
+
+    def needs_index(self) -> list[int]:
+        """Index the piles by the card their top accepts.
+
+        Entry ``number * 2 + color`` is a bitmask of the piles (bit i for
+        pile i) that a card with that number and color can be placed on.
+        A card has at most two such piles unless it is a King, which also
+        fits every empty pile. The returned list is reused between calls.
+
+        The index is kept between calls: only the piles whose top card
+        changed since the last call are moved to their new entries.
+        """
+        needs = self._needs
+        tops = self._tops
+        for i, pile in enumerate(self.piles):
+            visible = pile.visible_cards
+            top = visible[-1] if visible else None
+            old = tops[i]
+            if top is old:
+                continue
+            bit = 1 << i
+            if old is None:
+                needs[26] &= ~bit
+                needs[27] &= ~bit
+            elif old.number > 1:
+                needs[(old.number - 1) * 2 + 1 - old.color] &= ~bit
+            if top is None:
+                needs[26] |= bit
+                needs[27] |= bit
+            elif top.number > 1:
+                needs[(top.number - 1) * 2 + 1 - top.color] |= bit
+            tops[i] = top
+        return needs
 
     def initialize_from_deck(self, deck) -> None:
         """Set up the initial tableau from a deck of cards.
@@ -123,9 +221,13 @@ class Tableau:
         In Solitaire, the first pile gets 1 card, second gets 2, etc.
         The top card of each pile is face up.
         """
+        self.initialize_from_cards(deck.cards)
+
+    def initialize_from_cards(self, cards: list[Card]) -> None:
+        """Deal the initial tableau by popping 28 cards off the end of cards."""
         for i in range(7):
             # Take i + 1 cards for pile i
-            cards_for_pile = [deck.cards.pop() for _ in range(i + 1)]
+            cards_for_pile = [cards.pop() for _ in range(i + 1)]
             self.piles[i] = TableauPile(cards_for_pile)
 
     def get_top_card(self, pile_index: int) -> Card:
@@ -0,0 +1,256 @@
+"""Combined storage for the hand (stock) and the waste pile."""
+
+from .card import Card
+
+
+class Talon:
+    """The stock and the waste stored as one array with a cursor.
+
+    Slots below the cursor hold the waste, bottom to top. Slots from the
+    cursor up hold the stock, with the top of the stock at the lowest
+    slot. Cards played off the waste are not removed from the array; a
+    bitmap of live slots marks them as gone instead. That makes drawing,
+    playing the top waste card and recycling the waste O(1):
+
+    - Drawing takes the next live stock slots and reverses their contents
+      in place (at most three cards), so they read bottom to top as waste.
+    - Playing clears the bit of the highest live slot below the cursor.
+    - Recycling resets the cursor to 0. Read from the lowest slot up, the
+      waste is exactly the recycled stock from the top down.
+
+    Hand and Waste are views over a shared Talon; see Hand.view() and
+    Waste.view().
+    """
+
+    def __init__(self, stock: list[Card] | None = None, waste: list[Card] | None = None):
+        """Create a talon holding stock (in Hand order, top last) and waste."""
+        self._load(stock or [], waste or [])
+
+    def _load(self, stock: list[Card], waste: list[Card]) -> None:
+        """Rebuild the array from plain hand and waste lists."""
+        self.slots: list[Card] = list(waste) + stock[::-1]
+        self.slot_of: list[int] = [0] * 52  # card id -> slot index
+        for slot, card in enumerate(self.slots):
+            self.slot_of[card.id] = slot
+        self.live = (1 << len(self.slots)) - 1
+        self.cursor = len(waste)
+        self.stock_count = len(stock)
+        self.waste_count = len(waste)
+        self._shared = False  # slot lists are shared with a clone; copy before writing
+
+    def clone(self) -> "Talon":
+        """Return a copy-on-write twin sharing this talon's slot lists."""
+        twin = Talon.__new__(Talon)
+        twin.slots = self.slots
+        twin.slot_of = self.slot_of
+        twin.live = self.live
+        twin.cursor = self.cursor
+        twin.stock_count = self.stock_count
+        twin.waste_count = self.waste_count
+        twin._shared = self._shared = True
+        return twin
+
+    def _unshare(self) -> None:
+        """Take private copies of slot lists shared with a clone."""
+        self.slots = self.slots.copy()
+        self.slot_of = self.slot_of.copy()
+        self._shared = False
+
+    # -- Reading -------------------------------------------------------------
+
+    def stock_cards(self) -> list[Card]:
+        """Return the stock as a list in Hand order (top card last)."""
+        slots = self.slots
+        live = self.live >> self.cursor << self.cursor
+        cards = []
+        while live:
+            slot = live.bit_length() - 1
+            cards.append(slots[slot])
+            live ^= 1 << slot
+        return cards
+
+    def waste_cards(self) -> list[Card]:
+        """Return the waste as a list, bottom card first."""
+        slots = self.slots
+        live = self.live & ((1 << self.cursor) - 1)
+        cards = []
+        while live:
+            low = live & -live
+            cards.append(slots[low.bit_length() - 1])
+            live ^= low
+        return cards
+
+    def waste_top(self) -> Card | None:
+        """Return the top waste card, or None if the waste is empty."""
+        live = self.live & ((1 << self.cursor) - 1)
+        if not live:
+            return None
+        return self.slots[live.bit_length() - 1]
+
+    def visible_waste(self, count: int = 3) -> list[Card]:
+        """Return up to count cards from the top of the waste, bottom first."""
+        live = self.live & ((1 << self.cursor) - 1)
+        cards = []
+        while live and len(cards) < count:
+            slot = live.bit_length() - 1
+            cards.append(self.slots[slot])
+            live ^= 1 << slot
+        cards.reverse()
+        return cards
+
+    def reachable(self, count: int = 3) -> list[tuple[Card, int]]:
+        """List every card that some number of draws brings to the top of the waste.
+
+        Each entry is (card, draws): the fewest draw actions, counting a
+        recycle as one, after which card is on top of the waste with no
+        other move in between. The current top has 0 draws. Entries are
+        in order of draws. O(talon size).
+        """
+        stock = self.stock_cards()
+        waste = self.waste_cards()
+        reached = []
+        seen = set()
+        if waste:
+            reached.append((waste[-1], 0))
+            seen.add(waste[-1])
+        if not stock and not waste:
+            return reached
+
+        # A draw leaves the former top of the stock on top of the waste, so
+        # each pass reverses the groups it draws and the pass after it
+        # undoes that. The rest of this pass plus two full passes cover
+        # every card that can come up.
+        draws = 0
+        recycles = 0
+        while True:
+            draws += 1
+            if not stock:
+                recycles += 1
+                if recycles > 2:
+                    break
+                stock = waste[::-1]
+                waste = []
+                continue
+            drawn = stock[-count:]
+            del stock[-count:]
+            waste.extend(drawn)
+            card = drawn[-1]
+            if card not in seen:
+                seen.add(card)
+                reached.append((card, draws))
+        return reached
+
+    # -- Moves ---------------------------------------------------------------
+
+    def draw(self, count: int = 3) -> list[Card]:
+        """Move up to count cards from the stock to the waste.
+
+        Returns the drawn cards in the order Hand.draw_cards() always has:
+        the former top of the stock last, which is now the top of the waste.
+        """
+        live = self.live >> self.cursor << self.cursor
+        positions = []
+        while live and len(positions) < count:
+            low = live & -live
+            positions.append(low.bit_length() - 1)
+            live ^= low
+        if not positions:
+            return []
+
+        if self._shared:
+            self._unshare()
+        slots, slot_of = self.slots, self.slot_of
+        drawn = [slots[slot] for slot in reversed(positions)]
+        for slot, card in zip(positions, drawn):
+            slots[slot] = card
+            slot_of[card.id] = slot
+        self.cursor = positions[-1] + 1
+        self.stock_count -= len(drawn)
+        self.waste_count += len(drawn)
+        return drawn
+
+    def undraw(self, count: int) -> None:
+        """Take back a draw of count cards (undo of draw())."""
+        live = self.live & ((1 << self.cursor) - 1)
+        positions = []
+        for _ in range(count):
+            slot = live.bit_length() - 1
+            positions.append(slot)
+            live ^= 1 << slot
+        if not positions:
+            return
+
+        if self._shared:
+            self._unshare()
+        slots, slot_of = self.slots, self.slot_of
+        cards = [slots[slot] for slot in positions]
+        for slot, card in zip(reversed(positions), cards):
+            slots[slot] = card
+            slot_of[card.id] = slot
+        self.cursor = positions[-1]
+        self.stock_count += len(cards)
+        self.waste_count -= len(cards)
+
+    def play(self) -> Card:
+        """Remove and return the top waste card; the waste must not be empty."""
+        slot = (self.live & ((1 << self.cursor) - 1)).bit_length() - 1
+        self.live ^= 1 << slot
+        self.waste_count -= 1
+        return self.slots[slot]
+
+    def unplay(self, card: Card) -> None:
+        """Put the last played card back on the waste (undo of play())."""
+        self.live |= 1 << self.slot_of[card.id]
+        self.waste_count += 1
+
+    def recycle(self) -> None:
+        """Turn the waste over into the empty stock."""
+        self.cursor = 0
+        self.stock_count, self.waste_count = self.waste_count, 0
+
+    def unrecycle(self) -> None:
+        """Turn a freshly recycled stock back into the waste (undo of recycle())."""
+        self.cursor = len(self.slots)
+        self.stock_count, self.waste_count = 0, self.stock_count
+
+    # -- General edits (O(cards)) -------------------------------------------
+
+    def add_to_stock_bottom(self, cards: list[Card]) -> None:
+        """Put cards under the stock; cards[0] ends up at the very bottom."""
+        if self._shared:
+            self._unshare()
+        for card in reversed(cards):
+            self.slot_of[card.id] = len(self.slots)
+            self.live |= 1 << len(self.slots)
+            self.slots.append(card)
+        self.stock_count += len(cards)
+
+    def add_to_waste(self, cards: list[Card]) -> None:
+        """Put cards on top of the waste, in order."""
+        if self.cursor < len(self.slots):
+            self._load(self.stock_cards(), self.waste_cards() + list(cards))
+            return
+        if self._shared:
+            self._unshare()
+        for card in cards:
+            self.slot_of[card.id] = len(self.slots)
+            self.live |= 1 << len(self.slots)
+            self.slots.append(card)
+        self.cursor = len(self.slots)
+        self.waste_count += len(cards)
+
+    def set_slots(self, slots: list[int], cards: list[Card]) -> None:
+        """Put cards[i] into slot slots[i], leaving every other slot alone."""
+        if self._shared:
+            self._unshare()
+        for slot, card in zip(slots, cards):
+            self.slots[slot] = card
+            self.slot_of[card.id] = slot
+
+    def set_stock(self, cards: list[Card]) -> None:
+        """Replace the stock with cards (Hand order), keeping the waste."""
+        self._load(list(cards), self.waste_cards())
+
+    def set_waste(self, cards: list[Card]) -> None:
+        """Replace the waste with cards (bottom first), keeping the stock."""
+        self._load(self.stock_cards(), list(cards))
@@ -1,6 +1,7 @@
 """Implementation of the Solitaire waste pile."""
 
 from .card import Card
+from .talon import Talon
 
 
 class EmptyWasteError(Exception):
@@ -16,16 +17,34 @@ class Waste:
 
     The waste pile contains cards that have been drawn from the hand
     and are available for play.
+
+    A waste pile is a view of the waste part of a Talon; see Hand.
     """
 
     def __init__(self):
         """Initialize an empty waste pile."""
-        self.cards: list[Card] = []
+        self.talon = Talon()
+
+    @classmethod
+    def view(cls, talon: Talon) -> "Waste":
+        """Return a waste pile that reads and writes the waste of talon."""
+        waste = cls.__new__(cls)
+        waste.talon = talon
+        return waste
+
+    @property
+    def cards(self) -> list[Card]:
+        """The cards in the waste as a new list, top card last."""
+        return self.talon.waste_cards()
+
+    @cards.setter
+    def cards(self, cards: list[Card]) -> None:
+        self.talon.set_waste(cards)
 
     def add_cards(self, cards: list[Card]) -> None:
         """Add cards to the waste pile (from hand)."""
         # New cards go on top (end) of the waste pile
-        self.cards.extend(cards)
+        self.talon.add_to_waste(cards)
 
     def play_card(self) -> Card:
         """Take and remove the top card from the waste pile.
@@ -36,18 +55,21 @@ class Waste:
         Raises:
             EmptyWasteError: If trying to play from an empty waste pile.
         """
-        if not self.cards:
+        if not self.talon.waste_count:
             raise EmptyWasteError()
-        return self.cards.pop()
+        return self.talon.play()
 
     def peek_top_card(self) -> Card:
         """Look at the top card without removing it."""
-        return self.cards[-1]
+        card = self.talon.waste_top()
+        if card is None:
+            raise IndexError("The waste pile is empty")
+        return card
 
     def recycle_to_hand(self) -> list[Card]:
         """Remove all cards to be recycled back to the hand."""
-        cards = self.cards
-        self.cards = []
+        cards = self.talon.waste_cards()
+        self.talon.set_waste([])
         # Cards should be reversed when going back to hand
         # so they come out in the same order
         return cards[::-1]
@@ -58,8 +80,7 @@ class Waste:
         In Solitaire, typically the top 3 cards are visible,
         or all cards if fewer than 3 are present.
         """
-        visible_count = min(3, len(self.cards))
-        return self.cards[-visible_count:]
+        return self.talon.visible_waste(3)
 
     def __str__(self) -> str:
         visible = self.get_visible_cards()
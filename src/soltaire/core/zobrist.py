@@ -0,0 +1,48 @@
+"""Zobrist keys for hashing Klondike positions.
+
+A position hash is the XOR of one 64-bit key per card location plus one
+key per tableau hidden-card count. Locations are counted from the bottom
+of each zone, so moving cards on or off the top of a pile never changes
+the keys of the cards underneath and Game can update its hash in O(1)
+per moved card.
+"""
+
+import random
+
+MAX_PILE = 19  # 6 hidden cards plus a full King-to-Ace run
+MAX_TALON = 24  # cards left in hand + waste after the deal
+
+_rng = random.Random(0x5017A12E)
+
+
+def _keys(count: int) -> tuple[int, ...]:
+    return tuple(_rng.getrandbits(64) for _ in range(count))
+
+
+# Indexed by (pile * MAX_PILE + depth) * 52 + card_id
+TABLEAU_KEYS = _keys(7 * MAX_PILE * 52)
+# Indexed by pile * 7 + hidden_count
+HIDDEN_KEYS = _keys(7 * 7)
+# Indexed by position * 52 + card_id
+HAND_KEYS = _keys(MAX_TALON * 52)
+WASTE_KEYS = _keys(MAX_TALON * 52)
+# Indexed by card_id
+FOUNDATION_KEYS = _keys(52)
+
+
+def compute_hash(game) -> int:
+    """Compute the Zobrist hash of a game from scratch in O(52)."""
+    h = 0
+    for p, pile in enumerate(game.tableau.piles):
+        h ^= HIDDEN_KEYS[p * 7 + len(pile.hidden_cards)]
+        base = p * MAX_PILE
+        for depth, card in enumerate(pile.hidden_cards + pile.visible_cards):
+            h ^= TABLEAU_KEYS[(base + depth) * 52 + card.id]
+    for pile in game.foundations.piles.values():
+        for card in pile:
+            h ^= FOUNDATION_KEYS[card.id]
+    for i, card in enumerate(game.hand.cards):
+        h ^= HAND_KEYS[i * 52 + card.id]
+    for i, card in enumerate(game.waste.cards):
+        h ^= WASTE_KEYS[i * 52 + card.id]
+    return h
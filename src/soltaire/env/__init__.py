@@ -0,0 +1,14 @@
+"""Reinforcement learning environments for Klondike."""
+
+from .solitaire_env import FACE_DOWN, OBS_SHAPES, OBS_SIZE, KlondikeEnv
+from .vector_env import SHARED_MEMORY, SYNC, VectorKlondikeEnv
+
+__all__ = [
+    "FACE_DOWN",
+    "OBS_SHAPES",
+    "OBS_SIZE",
+    "SHARED_MEMORY",
+    "SYNC",
+    "KlondikeEnv",
+    "VectorKlondikeEnv",
+]
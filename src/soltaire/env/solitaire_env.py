@@ -0,0 +1,222 @@
+"""Gymnasium-style training environment on top of Game.
+
+KlondikeEnv follows the Gymnasium API (reset() -> (obs, info),
+step(action) -> (obs, reward, terminated, truncated, info)) without
+depending on gymnasium. Actions are the integer ids of core.actions.
+
+Observations are a dict of numpy arrays that are all views into one
+preallocated uint8 buffer (KlondikeEnv.buffer). Every reset() and step()
+overwrites the same arrays in place and returns the same dict, so an
+agent that wants to keep an observation must copy it:
+
+    tableau      (7, MAX_PILE) card ids per pile, bottom to top; face-down
+                 cards read FACE_DOWN and empty slots EMPTY
+    hidden       (7,)   face-down cards in each pile
+    waste        (3,)   the visible waste cards, top card last, EMPTY-padded
+                        at the front
+    foundations  (4,)   foundation heights, in SUITS order
+    action_mask  (NUM_ACTIONS,) bool, Game.valid_action_mask()
+
+A step only rewrites the tableau piles its action touched.
+
+Reward schema:
+
+    +1    per card put on a foundation (-1 per card taken back off)
+    +0.5  per tableau card turned face up
+    +10   for winning the game
+
+An episode terminates when the game is won or Game.is_stuck(), and is
+truncated after max_steps actions.
+"""
+
+import random
+
+import numpy as np
+
+from soltaire.core.actions import ACTION_TABLE, NUM_ACTIONS
+from soltaire.core.batch import EMPTY
+from soltaire.core.card import SUITS
+from soltaire.core.deal import MAX_DEAL
+from soltaire.core.game_logic import Game, UndoRecord
+from soltaire.core.zobrist import MAX_PILE
+
+FACE_DOWN = 53
+"""Tableau value of a face-down card in observations."""
+
+REWARD_FOUNDATION = 1.0
+REWARD_REVEAL = 0.5
+REWARD_WIN = 10.0
+
+DEFAULT_MAX_STEPS = 1000
+
+# Observation fields and their shapes, in buffer order
+OBS_SHAPES = {
+    "tableau": (7, MAX_PILE),
+    "hidden": (7,),
+    "waste": (3,),
+    "foundations": (4,),
+    "action_mask": (NUM_ACTIONS,),
+}
+OBS_SIZE = sum(int(np.prod(shape)) for shape in OBS_SHAPES.values())
+
+# Piles each action kind can change
+_TOUCHED = tuple(
+    (action[1], action[2])
+    if action[0] == "tableau_to_tableau"
+    else (action[2],)
+    if action[0] == "foundation_to_tableau"
+    else (action[1],)
+    if action[0] in ("waste_to_tableau", "tableau_to_foundation")
+    else ()
+    for action in ACTION_TABLE
+)
+
+
+def _reward(record: UndoRecord) -> float:
+    """Reward for the move that produced record, before any win bonus."""
+    kind = record.action[0]
+    reward = REWARD_REVEAL if record.flipped else 0.0
+    if kind in ("waste_to_foundation", "tableau_to_foundation"):
+        reward += REWARD_FOUNDATION
+    elif kind == "foundation_to_tableau":
+        reward -= REWARD_FOUNDATION
+    return reward
+
+
+def make_observation(buffer: np.ndarray) -> dict[str, np.ndarray]:
+    """Split a uint8 buffer into observation views.
+
+    buffer has OBS_SIZE bytes along its last axis; any leading axes (such
+    as a batch axis) are kept in front of each field's shape.
+    """
+    obs = {}
+    offset = 0
+    lead = buffer.shape[:-1]
+    for name, shape in OBS_SHAPES.items():
+        size = int(np.prod(shape))
+        view = buffer[..., offset : offset + size].reshape(lead + shape)
+        obs[name] = view.view(bool) if name == "action_mask" else view
+        offset += size
+    return obs
+
+
+def write_observation(game: Game, obs: dict[str, np.ndarray]) -> None:
+    """Encode game into the views of make_observation(), overwriting them."""
+    hidden = obs["hidden"]
+    for i, pile in enumerate(game.tableau.piles):
+        hidden[i] = len(pile.hidden_cards)
+        _write_pile(game, obs, i)
+    _write_talon_and_foundations(game, obs)
+
+
+def _write_pile(game: Game, obs: dict[str, np.ndarray], index: int) -> None:
+    pile = game.tableau.piles[index]
+    row = obs["tableau"][index]
+    hidden = len(pile.hidden_cards)
+    end = hidden + len(pile.visible_cards)
+    row[:hidden] = FACE_DOWN
+    row[hidden:end] = [card.id for card in pile.visible_cards]
+    row[end:] = EMPTY
+
+
+def _write_talon_and_foundations(game: Game, obs: dict[str, np.ndarray]) -> None:
+    waste = obs["waste"]
+    top = [card.id for card in game.talon.visible_waste(3)]
+    waste[: 3 - len(top)] = EMPTY
+    waste[3 - len(top) :] = top
+    piles = game.foundations.piles
+    obs["foundations"][:] = [len(piles[suit]) for suit in SUITS]
+    game.valid_action_mask(obs["action_mask"])
+
+
+class KlondikeEnv:
+    """Draw-3 Klondike as a reinforcement learning environment."""
+
+    def __init__(
+        self,
+        max_steps: int = DEFAULT_MAX_STEPS,
+        autoplay: bool = False,
+        buffer: np.ndarray | None = None,
+    ):
+        """Create the environment; call reset() before step().
+
+        Args:
+            max_steps: Truncate an episode after this many actions.
+            autoplay: Run Game.autoplay_safe() after reset() and every
+                step, so safe foundation plays are never agent decisions.
+                Their rewards are added to the step's reward.
+            buffer: Optional uint8 array of OBS_SIZE bytes to write
+                observations into, e.g. one row of a larger batch buffer.
+        """
+        self.max_steps = max_steps
+        self.autoplay = autoplay
+        if buffer is None:
+            buffer = np.zeros(OBS_SIZE, dtype=np.uint8)
+        self.buffer = buffer
+        self.obs = make_observation(buffer)
+        self.game: Game | None = None
+        self.steps = 0
+        self._rng = random.Random()
+
+    def reset(self, seed: int | None = None, options: dict | None = None):
+        """Start a new episode.
+
+        Args:
+            seed: Deal number to play (see Game(deal=...)); it also seeds
+                the choice of later deals reset without a seed.
+            options: Unused; accepted for Gymnasium compatibility.
+
+        Returns:
+            (obs, info), where info holds the deal number.
+        """
+        if seed is not None:
+            self._rng.seed(seed)
+            deal = seed
+        else:
+            deal = self._rng.randrange(MAX_DEAL)
+        self.game = Game(deal=deal)
+        self.steps = 0
+        if self.autoplay:
+            self.game.autoplay_safe()
+        write_observation(self.game, self.obs)
+        return self.obs, {"deal": deal}
+
+    def step(self, action: int):
+        """Play the action with this id.
+
+        Returns:
+            (obs, reward, terminated, truncated, info).
+
+        Raises:
+            ValueError: If the action is not an action id or not legal in
+                the current position.
+        """
+        game = self.game
+        if not 0 <= action < NUM_ACTIONS:
+            raise ValueError(f"Unknown action id: {action}")
+        if not self.obs["action_mask"][action]:
+            raise ValueError(f"Illegal action: {ACTION_TABLE[action]}")
+        record = game.apply_legal_id(action)
+        self.steps += 1
+        reward = _reward(record)
+        if self.autoplay:
+            records = game.autoplay_safe()
+        else:
+            records = ()
+
+        if records:
+            reward += sum(_reward(played) for played in records)
+            write_observation(game, self.obs)  # autoplay may have touched any pile
+        else:
+            for pile in _TOUCHED[action]:
+                _write_pile(game, self.obs, pile)
+            if record.flipped:
+                self.obs["hidden"][_TOUCHED[action][0]] -= 1
+            _write_talon_and_foundations(game, self.obs)
+
+        won = game.foundations.is_complete()
+        if won:
+            reward += REWARD_WIN
+        terminated = won or game.is_stuck()
+        truncated = not terminated and self.steps >= self.max_steps
+        return self.obs, reward, terminated, truncated, {"deal": game.deal}
@@ -0,0 +1,276 @@
+"""Many KlondikeEnvs stepped together, in process or on worker processes.
+
+VectorKlondikeEnv keeps everything that changes per step in one block of
+arrays:
+
+    obs          (N, OBS_SIZE) observation buffers, one KlondikeEnv each
+    actions      (N,)  action ids for the next step
+    rewards      (N,)
+    terminated   (N,)
+    truncated    (N,)
+    deals        (N,)  deal number of each env's current episode
+    seeds        (N,)  deal numbers for the next reset()
+    seeded       (N,)  whether seeds holds a value for that env
+
+In the "sync" mode the block is a plain numpy buffer and the envs run in
+this process. In the "shared_memory" mode the block lives in a
+multiprocessing.shared_memory segment and each worker process owns a
+contiguous range of envs whose KlondikeEnv writes straight into it. A
+step then only sends one short command to each worker and waits for an
+equally short reply; no observation is ever pickled.
+
+Envs reset automatically: when an episode terminates or is truncated, the
+env starts its next deal in the same step. rewards, terminated and
+truncated describe the finished episode, while obs already shows the
+first position of the next one.
+"""
+
+import os
+import traceback
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from soltaire.core.deal import MAX_DEAL
+
+from .solitaire_env import OBS_SIZE, KlondikeEnv, make_observation
+
+SYNC = "sync"
+SHARED_MEMORY = "shared_memory"
+
+_RESET = b"r"
+_STEP = b"s"
+_CLOSE = b"c"
+
+# A worker replies b"" on success, else one of these bytes and the error text
+_VALUE_ERROR = b"v"
+_ERROR = b"e"
+
+# Arrays of the shared block after obs: name and dtype, one entry per env
+_FIELDS = (
+    ("actions", np.int64),
+    ("rewards", np.float64),
+    ("terminated", np.bool_),
+    ("truncated", np.bool_),
+    ("deals", np.uint64),
+    ("seeds", np.uint64),
+    ("seeded", np.bool_),
+)
+
+
+def _layout(num_envs: int) -> tuple[list[tuple[str, np.dtype, tuple, int]], int]:
+    """Return (name, dtype, shape, offset) of every array, and the total size."""
+    fields = [("obs", np.dtype(np.uint8), (num_envs, OBS_SIZE), 0)]
+    offset = num_envs * OBS_SIZE
+    for name, dtype in _FIELDS:
+        dtype = np.dtype(dtype)
+        offset = -(-offset // 8) * 8  # keep every array 8-byte aligned
+        fields.append((name, dtype, (num_envs,), offset))
+        offset += num_envs * dtype.itemsize
+    return fields, offset
+
+
+def _arrays(buffer, num_envs: int) -> dict[str, np.ndarray]:
+    """Map the arrays of the block onto buffer (anything with a buffer protocol)."""
+    fields, _ = _layout(num_envs)
+    return {
+        name: np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset)
+        for name, dtype, shape, offset in fields
+    }
+
+
+def _reset_range(envs: list[KlondikeEnv], arrays: dict, start: int) -> None:
+    """Reset envs, the block rows start, start + 1, ..."""
+    seeds, seeded, deals = arrays["seeds"], arrays["seeded"], arrays["deals"]
+    for row, env in enumerate(envs, start):
+        seed = int(seeds[row]) if seeded[row] else None
+        deals[row] = env.reset(seed=seed)[1]["deal"]
+    arrays["rewards"][start : start + len(envs)] = 0.0
+    arrays["terminated"][start : start + len(envs)] = False
+    arrays["truncated"][start : start + len(envs)] = False
+
+
+def _step_range(envs: list[KlondikeEnv], arrays: dict, start: int) -> None:
+    """Step envs with their actions from the block, resetting finished ones."""
+    actions, rewards = arrays["actions"], arrays["rewards"]
+    terminated, truncated = arrays["terminated"], arrays["truncated"]
+    deals = arrays["deals"]
+    for row, env in enumerate(envs, start):
+        _, reward, done, cut, _ = env.step(int(actions[row]))
+        rewards[row] = reward
+        terminated[row] = done
+        truncated[row] = cut
+        if done or cut:
+            deals[row] = env.reset()[1]["deal"]
+
+
+def _worker(
+    shm_name: str, num_envs: int, start: int, stop: int, env_kwargs: dict, conn
+) -> None:
+    """Worker process: run envs start..stop-1 of the shared block on command."""
+    shm = SharedMemory(name=shm_name)
+    try:
+        arrays = _arrays(shm.buf, num_envs)
+        obs = arrays["obs"]
+        envs = [KlondikeEnv(buffer=obs[row], **env_kwargs) for row in range(start, stop)]
+        while True:
+            command = conn.recv_bytes()
+            if command == _CLOSE:
+                break
+            try:
+                if command == _STEP:
+                    _step_range(envs, arrays, start)
+                else:
+                    _reset_range(envs, arrays, start)
+            except ValueError as error:
+                conn.send_bytes(_VALUE_ERROR + str(error).encode())
+            except Exception:
+                conn.send_bytes(_ERROR + traceback.format_exc().encode())
+            else:
+                conn.send_bytes(b"")
+        del envs, obs, arrays  # release views of shm.buf before closing it
+    finally:
+        shm.close()
+
+
+class VectorKlondikeEnv:
+    """N KlondikeEnvs with batched observations and automatic resets."""
+
+    def __init__(
+        self,
+        num_envs: int,
+        mode: str = SYNC,
+        workers: int | None = None,
+        **env_kwargs,
+    ):
+        """Create the envs; call reset() before step().
+
+        Args:
+            num_envs: Number of environments.
+            mode: SYNC to step every env in this process, or SHARED_MEMORY
+                to step them on worker processes through shared memory.
+            workers: Worker processes for SHARED_MEMORY; defaults to the
+                number of CPUs, and never exceeds num_envs.
+            env_kwargs: Passed to every KlondikeEnv (max_steps, autoplay).
+
+        Raises:
+            ValueError: If mode is not SYNC or SHARED_MEMORY.
+        """
+        if mode not in (SYNC, SHARED_MEMORY):
+            raise ValueError(f"Unknown mode: {mode!r}")
+        self.num_envs = num_envs
+        self.mode = mode
+        self._shm = None
+        self._processes = []
+        self._conns = []
+        _, size = _layout(num_envs)
+
+        if mode == SYNC:
+            self._arrays = _arrays(bytearray(size), num_envs)
+            obs = self._arrays["obs"]
+            self._envs = [
+                KlondikeEnv(buffer=obs[row], **env_kwargs) for row in range(num_envs)
+            ]
+        else:
+            self._shm = SharedMemory(create=True, size=size)
+            self._arrays = _arrays(self._shm.buf, num_envs)
+            workers = min(workers or os.cpu_count() or 1, num_envs)
+            context = get_context()
+            bounds = np.linspace(0, num_envs, workers + 1).astype(int)
+            for start, stop in zip(bounds[:-1], bounds[1:]):
+                conn, child = context.Pipe()
+                process = context.Process(
+                    target=_worker,
+                    args=(self._shm.name, num_envs, start, stop, env_kwargs, child),
+                    daemon=True,
+                )
+                process.start()
+                child.close()
+                self._processes.append(process)
+                self._conns.append(conn)
+
+        self.obs = make_observation(self._arrays["obs"])
+        self.actions = self._arrays["actions"]
+        self.rewards = self._arrays["rewards"]
+        self.terminated = self._arrays["terminated"]
+        self.truncated = self._arrays["truncated"]
+        self.deals = self._arrays["deals"]
+
+    def reset(self, seed: int | None = None, options: dict | None = None):
+        """Start a new episode in every env.
+
+        Args:
+            seed: Env i plays deal seed + i, and later deals follow from
+                that; without a seed each env continues with random deals.
+            options: Unused; accepted for Gymnasium compatibility.
+
+        Returns:
+            (obs, info): obs maps each field to an (N, ...) array and
+            info["deal"] holds the deal number of every env.
+        """
+        seeds, seeded = self._arrays["seeds"], self._arrays["seeded"]
+        if seed is None:
+            seeded[:] = False
+        else:
+            seeds[:] = [(seed + i) % MAX_DEAL for i in range(self.num_envs)]
+            seeded[:] = True
+        self._run(_RESET)
+        return self.obs, {"deal": self.deals}
+
+    def step(self, actions):
+        """Play one action id per env.
+
+        The returned arrays are views of this env's buffers and are
+        overwritten by the next call.
+
+        Returns:
+            (obs, rewards, terminated, truncated, info), batched like reset().
+
+        Raises:
+            ValueError: If any action is illegal in its env. Envs stepped
+                before the failing one have already moved.
+            RuntimeError: If a worker process failed with any other error;
+                the message holds the worker's traceback.
+        """
+        self.actions[:] = actions
+        self._run(_STEP)
+        return self.obs, self.rewards, self.terminated, self.truncated, {"deal": self.deals}
+
+    def _run(self, command: bytes) -> None:
+        if self.mode == SYNC:
+            if command == _STEP:
+                _step_range(self._envs, self._arrays, 0)
+            else:
+                _reset_range(self._envs, self._arrays, 0)
+            return
+        for conn in self._conns:
+            conn.send_bytes(command)
+        replies = [conn.recv_bytes() for conn in self._conns]
+        for reply in replies:
+            if reply[:1] == _VALUE_ERROR:
+                raise ValueError(reply[1:].decode())
+            if reply:
+                raise RuntimeError(f"Worker process failed:\n{reply[1:].decode()}")
+
+    def close(self) -> None:
+        """Stop the worker processes and free the shared memory block."""
+        for conn in self._conns:
+            conn.send_bytes(_CLOSE)
+            conn.close()
+        for process in self._processes:
+            process.join()
+        self._conns, self._processes = [], []
+        if self._shm is not None:
+            self.obs = self._arrays = None
+            self.actions = self.rewards = self.terminated = self.truncated = None
+            self.deals = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> "VectorKlondikeEnv":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -21,9 +21,11 @@ from PyQt6.QtWidgets import (
 
 from soltaire.core.card import Card
 from soltaire.core.game_logic import Game
+from soltaire.solver import solve
 
 CARD_W, CARD_H = 71, 96
 CARD_OVERLAP = 30  # Pixels of vertical overlap for stacked cards in tableau
+HINT_BUDGET_MS = 200  # Time the hint search may take
 
 _SUIT_TO_SVG = {
     "Hearts": "heart",
@@ -399,10 +401,10 @@ class SolitaireGUI(QMainWindow):
         If hand is empty, automatically recycle waste back to hand.
         """
         if self.game.hand.is_empty():
-            # Auto-recycle waste when hand is empty
-            recycled = self.game.waste.recycle_to_hand()
-            self.game.hand.add_cards(recycled)
-        
+            # Auto-recycle waste when hand is empty; going through Game keeps
+            # its state hash and stuck tracking in sync
+            self.game.draw_cards()
+
         # Draw 3 cards from hand to waste
         self.game.draw_cards()
         self.update_display()
@@ -802,12 +804,20 @@ class SolitaireGUI(QMainWindow):
             return False
 
     def handle_help(self) -> None:
-        """Highlight all valid moves: sources in blue, targets in orange."""
+        """Highlight the suggested move: source in blue, target in orange.
+
+        The suggestion comes from a search of at most HINT_BUDGET_MS over
+        Game.determinize(), so it never uses the face-down cards. If the
+        search finds nothing to suggest, every valid move is highlighted.
+        """
         self.clear_selection()
         self._hint_source_locations.clear()
         self._hint_target_locations.clear()
         self._hint_draw = False
         actions = self.game.get_valid_actions()
+        result = solve(self.game.determinize(), HINT_BUDGET_MS)
+        if result.moves and result.moves[0] in actions:
+            actions = [result.moves[0]]
         self._translate_actions_to_hints(actions)
         self._update_visual_feedback()
 
@@ -0,0 +1,6 @@
+"""Parallel simulation of agents over ranges of deals."""
+
+from .inference import serve_games
+from .runner import GameResult, play_deal, run_games
+
+__all__ = ["GameResult", "play_deal", "run_games", "serve_games"]
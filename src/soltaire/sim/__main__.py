@@ -0,0 +1,3 @@
+from soltaire.sim.runner import main
+
+main()
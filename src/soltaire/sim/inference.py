@@ -0,0 +1,192 @@
+"""Actor processes with one batched inference server, on one machine.
+
+Following the SEED RL layout, env stepping and policy calls are split:
+
+- Each actor process owns one KlondikeEnv whose observation buffer is a
+  row of a shared memory block. To ask for an action it sends an empty
+  message over its pipe, then waits for the reply and reads its action
+  from the block.
+- The server (the calling process) collects those requests and calls
+  agent.act_batch() once per batch: when max_batch requests are waiting,
+  when the oldest has waited max_wait_us, or when every live actor is
+  waiting. It writes the actions into the block and wakes the actors.
+
+Observations never cross a pipe; only the per-episode GameResult is
+pickled.
+"""
+
+import os
+import pickle
+import time
+from collections.abc import Iterator
+from multiprocessing import get_context
+from multiprocessing.connection import wait
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from soltaire.agents.base import BaseAgent
+from soltaire.env.solitaire_env import OBS_SIZE, KlondikeEnv, make_observation
+
+from .runner import DEFAULT_MAX_MOVES, GameResult
+
+DEFAULT_MAX_WAIT_US = 500
+
+_REQUEST = b""
+
+
+def _actions_offset(actors: int) -> int:
+    """Start of the actions array: after the observation rows, 8-byte aligned."""
+    return -(-actors * OBS_SIZE // 8) * 8
+
+
+def _block_size(actors: int) -> int:
+    """Bytes of shared memory for actors observation rows and actions."""
+    return _actions_offset(actors) + actors * 8
+
+
+def _block(buffer, actors: int) -> tuple[np.ndarray, np.ndarray]:
+    """Map (obs, actions) onto buffer."""
+    obs = np.ndarray((actors, OBS_SIZE), dtype=np.uint8, buffer=buffer)
+    offset = _actions_offset(actors)
+    actions = np.ndarray((actors,), dtype=np.int64, buffer=buffer, offset=offset)
+    return obs, actions
+
+
+def _actor(
+    shm_name: str, actors: int, index: int, deals: range, env_kwargs: dict, conn
+) -> None:
+    """Actor process: play deals, asking the server for every action."""
+    shm = SharedMemory(name=shm_name)
+    try:
+        obs_rows, actions = _block(shm.buf, actors)
+        env = KlondikeEnv(buffer=obs_rows[index], **env_kwargs)
+        for deal in deals:
+            start = time.perf_counter()
+            obs, _ = env.reset(seed=deal)
+            moves = 0
+            done = False
+            while not done:
+                conn.send_bytes(_REQUEST)
+                conn.recv_bytes()
+                _, _, terminated, truncated, _ = env.step(int(actions[index]))
+                moves += 1
+                done = terminated or truncated
+            foundation_cards = int(obs["foundations"].sum())
+            result = GameResult(
+                deal,
+                foundation_cards == 52,
+                moves,
+                foundation_cards,
+                time.perf_counter() - start,
+            )
+            conn.send_bytes(pickle.dumps(result))
+        del env, obs_rows, actions, obs  # release views of shm.buf before closing it
+    finally:
+        conn.close()
+        shm.close()
+
+
+def serve_games(
+    agent: BaseAgent,
+    deals: range,
+    actors: int | None = None,
+    max_batch: int | None = None,
+    max_wait_us: float = DEFAULT_MAX_WAIT_US,
+    max_moves: int = DEFAULT_MAX_MOVES,
+    autoplay: bool = False,
+) -> Iterator[GameResult]:
+    """Play every deal in deals on actor processes served by agent.act_batch().
+
+    Args:
+        agent: Agent answering the batched requests in this process.
+        deals: Deal numbers to play; actor i plays deals[i::actors].
+        actors: Number of actor processes; defaults to the CPU count.
+        max_batch: Largest batch passed to act_batch(); defaults to actors.
+        max_wait_us: Longest time the first request of a batch waits for
+            more requests to join it, in microseconds.
+        max_moves: Cap on actions per game (KlondikeEnv max_steps).
+        autoplay: Passed to KlondikeEnv.
+
+    Yields:
+        One GameResult per deal, in the order the games finish.
+
+    Raises:
+        RuntimeError: If an actor process dies before playing all its deals.
+    """
+    if not deals:
+        return
+    actors = min(actors or os.cpu_count() or 1, len(deals))
+    max_batch = max_batch or actors
+    max_wait = max_wait_us / 1e6
+    env_kwargs = {"max_steps": max_moves, "autoplay": autoplay}
+
+    shm = SharedMemory(create=True, size=_block_size(actors))
+    obs_rows, actions = _block(shm.buf, actors)
+    obs = make_observation(obs_rows)
+    context = get_context()
+    conns, processes = [], []
+    try:
+        for index in range(actors):
+            conn, child = context.Pipe()
+            process = context.Process(
+                target=_actor,
+                args=(shm.name, actors, index, deals[index::actors], env_kwargs, child),
+                daemon=True,
+            )
+            process.start()
+            child.close()
+            conns.append(conn)
+            processes.append(process)
+
+        actor_of = {conn: index for index, conn in enumerate(conns)}
+        live = set(conns)
+        pending = []  # (actor index, arrival time), oldest first
+        finished = 0
+        while live:
+            timeout = None
+            if pending:
+                timeout = max(0.0, pending[0][1] + max_wait - time.perf_counter())
+            for conn in wait(live, timeout):
+                try:
+                    message = conn.recv_bytes()
+                except EOFError:
+                    live.discard(conn)
+                    process = processes[actor_of[conn]]
+                    process.join()
+                    if process.exitcode:
+                        raise RuntimeError(
+                            f"Actor {actor_of[conn]} exited with code "
+                            f"{process.exitcode}"
+                        )
+                    continue
+                if message == _REQUEST:
+                    pending.append((actor_of[conn], time.perf_counter()))
+                else:
+                    finished += 1
+                    yield pickle.loads(message)
+
+            while pending and (
+                len(pending) >= max_batch
+                or len(pending) >= len(live)
+                or time.perf_counter() >= pending[0][1] + max_wait
+            ):
+                batch, pending = pending[:max_batch], pending[max_batch:]
+                rows = np.array([index for index, _ in batch])
+                actions[rows] = agent.act_batch(
+                    {name: view[rows] for name, view in obs.items()}
+                )
+                for index in rows.tolist():
+                    conns[index].send_bytes(_REQUEST)
+        if finished < len(deals):
+            raise RuntimeError(f"Only {finished} of {len(deals)} games finished")
+    finally:
+        for conn in conns:
+            conn.close()
+        for process in processes:
+            process.join(timeout=1)
+            if process.is_alive():
+                process.terminate()
+        obs = obs_rows = actions = None
+        shm.close()
+        shm.unlink()
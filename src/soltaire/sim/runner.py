@@ -0,0 +1,175 @@
+"""Run an agent over a range of deals on a process pool.
+
+Workers receive only the agent class and a range of deal numbers; each
+one deals its games locally in a KlondikeEnv, so nothing but small
+result tuples ever crosses a process boundary. Results are streamed back
+chunk by chunk as workers finish.
+
+Usage::
+
+    python -m soltaire.sim mypackage.agents:MyAgent --count 1000000
+"""
+
+import argparse
+import importlib
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, NamedTuple
+
+from soltaire.agents.base import BaseAgent
+from soltaire.env.solitaire_env import KlondikeEnv
+
+DEFAULT_MAX_MOVES = 1000
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class GameResult(NamedTuple):
+    """Outcome of one simulated game."""
+
+    deal: int
+    won: bool
+    moves: int
+    foundation_cards: int
+    wall_time: float  # seconds spent playing the game
+
+
+def play_deal(
+    agent: BaseAgent, deal: int, max_moves: int = DEFAULT_MAX_MOVES
+) -> GameResult:
+    """Play one deal to the end with agent and report the result.
+
+    The deal is played in a KlondikeEnv. The agent is reset with the deal
+    number as its seed and then asked for an action id with act(obs) until
+    the episode terminates (won or stuck) or max_moves actions have been
+    played.
+
+    Raises:
+        ValueError: If the agent returns an illegal action.
+    """
+    start = time.perf_counter()
+    env = KlondikeEnv(max_steps=max_moves)
+    obs, _ = env.reset(seed=deal)
+    agent.reset(seed=deal)
+    moves = 0
+    done = False
+    while not done:
+        obs, _, terminated, truncated, _ = env.step(agent.act(obs))
+        moves += 1
+        done = terminated or truncated
+    foundation_cards = int(obs["foundations"].sum())
+    return GameResult(
+        deal, foundation_cards == 52, moves, foundation_cards, time.perf_counter() - start
+    )
+
+
+def _play_chunk(
+    agent_cls: type[BaseAgent],
+    agent_kwargs: dict[str, Any],
+    deals: range,
+    max_moves: int,
+) -> list[GameResult]:
+    """Worker entry point: play every deal in deals with one agent instance."""
+    agent = agent_cls(**agent_kwargs)
+    return [play_deal(agent, deal, max_moves) for deal in deals]
+
+
+def run_games(
+    agent_cls: type[BaseAgent],
+    deals: range,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_moves: int = DEFAULT_MAX_MOVES,
+    agent_kwargs: dict[str, Any] | None = None,
+) -> Iterator[GameResult]:
+    """Play every deal in deals and yield the results as they come in.
+
+    Args:
+        agent_cls: Agent class, importable by the worker processes. Each
+            chunk builds one instance with agent_cls(**agent_kwargs).
+        deals: Deal numbers to play (see deal_from_index()).
+        workers: Number of worker processes; defaults to the CPU count.
+            With 1 the games are played in this process.
+        chunk_size: Deals handed to a worker at a time.
+        max_moves: Cap on actions per game.
+        agent_kwargs: Keyword arguments for agent_cls.
+
+    Yields:
+        One GameResult per deal. Results within a chunk are in deal
+        order; chunks arrive in the order they finish.
+    """
+    agent_kwargs = agent_kwargs or {}
+    workers = workers or os.cpu_count() or 1
+    chunks = (deals[i : i + chunk_size] for i in range(0, len(deals), chunk_size))
+
+    if workers == 1:
+        for chunk in chunks:
+            yield from _play_chunk(agent_cls, agent_kwargs, chunk, max_moves)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Keep a couple of chunks queued per worker rather than submitting
+        # the whole range up front.
+        pending = set()
+        for chunk in chunks:
+            pending.add(
+                pool.submit(_play_chunk, agent_cls, agent_kwargs, chunk, max_moves)
+            )
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+
+def _load_agent(path: str) -> type[BaseAgent]:
+    """Resolve a "package.module:ClassName" string."""
+    module_name, _, class_name = path.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point; prints a summary of the run."""
+    parser = argparse.ArgumentParser(
+        prog="python -m soltaire.sim", description="Evaluate an agent over many deals."
+    )
+    parser.add_argument("agent", help='agent class as "package.module:ClassName"')
+    parser.add_argument("--start", type=int, default=0, help="first deal number")
+    parser.add_argument("--count", type=int, default=1000, help="number of deals")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--max-moves", type=int, default=DEFAULT_MAX_MOVES)
+    args = parser.parse_args(argv)
+
+    agent_cls = _load_agent(args.agent)
+    start = time.perf_counter()
+    games = wins = moves = foundation_cards = 0
+    for result in run_games(
+        agent_cls,
+        range(args.start, args.start + args.count),
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        max_moves=args.max_moves,
+    ):
+        games += 1
+        wins += result.won
+        moves += result.moves
+        foundation_cards += result.foundation_cards
+    elapsed = time.perf_counter() - start
+
+    if not games:
+        print("No games played.")
+        return
+    print(f"Games:            {games}")
+    print(f"Won:              {wins} ({wins / games:.2%})")
+    print(f"Mean moves:       {moves / games:.1f}")
+    print(f"Mean foundation:  {foundation_cards / games:.2f}")
+    print(f"Games per second: {games / elapsed:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""Search-based solvers for Klondike."""
+
+from .dfs import (
+    KEY_CANONICAL,
+    KEY_HASH,
+    SOLVED,
+    UNKNOWN,
+    UNSOLVABLE,
+    Solver,
+    SolveResult,
+    ordered_moves,
+    solve,
+)
+from .transposition import TranspositionTable
+
+__all__ = [
+    "KEY_CANONICAL",
+    "KEY_HASH",
+    "SOLVED",
+    "UNKNOWN",
+    "UNSOLVABLE",
+    "SolveResult",
+    "Solver",
+    "TranspositionTable",
+    "ordered_moves",
+    "solve",
+]
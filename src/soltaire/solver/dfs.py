@@ -0,0 +1,261 @@
+"""Depth-first solver for thoughtful Klondike (every card known)."""
+
+import time
+from typing import NamedTuple
+
+from soltaire.core.game_logic import Game, UndoRecord
+from soltaire.core.game_rules import CAN_STACK
+from soltaire.core.symmetry import canonical_key
+
+from .macros import STOCK_TO_FOUNDATION, apply_legal, stock_moves
+from .transposition import TranspositionTable
+
+SOLVED = "solved"
+UNSOLVABLE = "unsolvable"
+UNKNOWN = "unknown"  # the node or time budget ran out first
+
+DEFAULT_MAX_NODES = 1_000_000
+
+# Transposition table key modes
+KEY_HASH = "hash"
+KEY_CANONICAL = "canonical"
+_KEY_FUNCTIONS = {
+    KEY_HASH: lambda game: game.state_hash,
+    KEY_CANONICAL: canonical_key,
+}
+
+_CLOCK_INTERVAL = 64  # nodes between deadline checks
+
+_TALON_KINDS = ("draw", "waste_to_foundation", "waste_to_tableau")
+
+
+class SolveResult(NamedTuple):
+    """Outcome of a solver run."""
+
+    # SOLVED (a real win), UNSOLVABLE (no win among the searched moves) or UNKNOWN
+    status: str
+    moves: list[tuple]  # winning line when SOLVED, else the best line found
+    nodes: int  # positions generated
+    depth: int  # deepest search line reached, in searched moves
+
+
+def ordered_moves(game: Game, macros: bool = True) -> list[tuple]:
+    """Return the moves worth searching in game, most promising first.
+
+    Starts from get_valid_actions() and drops the usual unproductive
+    tableau moves:
+
+    - moving a whole pile with no hidden cards onto an empty pile, which
+      only swaps two piles;
+    - moving part of a face-up run unless the card it uncovers can go to
+      its foundation or take a card from the talon.
+
+    With macros, the draw and the waste plays are replaced by the stock
+    macro moves of core.solver.macros. The moves are ordered foundation
+    moves, moves that turn up a hidden card (deepest pile first), plays
+    of the waste top, other tableau moves, and then the talon plays that
+    need draws (or the draw itself).
+    """
+    piles = game.tableau.piles
+    foundations = game.foundations
+    if macros:
+        reachable = game.talon.reachable()
+        talon_cards = [card for card, _ in reachable]
+    else:
+        waste_top = game.talon.waste_top()
+        talon_cards = [waste_top] if waste_top is not None else []
+
+    foundation, reveal, waste, other, later = [], [], [], [], []
+    for action in game.get_valid_actions():
+        kind = action[0]
+        if kind == "tableau_to_tableau":
+            source = piles[action[1]]
+            visible = source.visible_cards
+            if action[3] < len(visible):
+                uncovered = visible[-action[3] - 1]
+                if foundations.can_add_card(uncovered) or any(
+                    CAN_STACK[card.id * 52 + uncovered.id] for card in talon_cards
+                ):
+                    other.append(action)
+            elif source.hidden_cards:
+                reveal.append(action)
+            elif piles[action[2]].visible_cards:
+                other.append(action)  # empties a pile for a King
+        elif macros and kind in _TALON_KINDS:
+            continue
+        elif kind == "waste_to_tableau":
+            waste.append(action)
+        elif kind == "draw":
+            later.append(action)
+        else:
+            foundation.append(action)
+
+    if macros:
+        for action in stock_moves(game, reachable):
+            if action[0] == STOCK_TO_FOUNDATION:
+                foundation.append(action)
+            elif action[1] == 0:
+                waste.append(action)
+            else:
+                later.append(action)
+
+    reveal.sort(key=lambda action: len(piles[action[1]].hidden_cards), reverse=True)
+    return foundation + reveal + waste + other + later
+
+
+class Solver:
+    """Depth-first search over a Game with a bounded transposition table.
+
+    The search plays moves with Game.apply_legal() and takes them back
+    with Game.undo(), so it needs a single Game and no copies. Positions
+    are keyed by Game.state_hash (or a canonical key, see __init__); a
+    position already in the table has been searched before, or is on the
+    current line, and is skipped.
+
+    Foundation-to-tableau moves are not searched, and ordered_moves()
+    prunes tableau moves the way Klondike solvers usually do. SOLVED is
+    always a real win; UNSOLVABLE means no win exists among the moves
+    searched, which in rare deals can miss one.
+    """
+
+    def __init__(
+        self,
+        max_nodes: int = DEFAULT_MAX_NODES,
+        table_bits: int = 20,
+        macros: bool = True,
+        autoplay: bool = True,
+        key: str = KEY_HASH,
+    ):
+        """Create a solver.
+
+        Args:
+            max_nodes: Give up with UNKNOWN after generating this many positions.
+            table_bits: The transposition table holds 2**table_bits keys.
+            macros: Search stock macro moves (see solver.macros) instead
+                of single draws.
+            autoplay: Run Game.autoplay_safe() after every move, so safe
+                foundation plays are never search decisions.
+            key: What the transposition table stores per position:
+                KEY_HASH for Game.state_hash, or KEY_CANONICAL for
+                core.symmetry.canonical_key(), which also recognizes
+                positions that only differ by swapping same-colored
+                suits or reordering piles. Canonical keys cost more per
+                node but store fewer positions.
+
+        Raises:
+            ValueError: If key is not a known key mode.
+        """
+        if key not in _KEY_FUNCTIONS:
+            raise ValueError(f"Unknown key mode: {key!r}")
+        self.max_nodes = max_nodes
+        self.macros = macros
+        self.autoplay = autoplay
+        self.key = key
+        self.table = TranspositionTable(table_bits)
+
+    def solve(self, game: Game, budget_ms: float | None = None) -> SolveResult:
+        """Search for a winning line from the current position of game.
+
+        game is not modified. The returned moves are action tuples in the
+        get_valid_actions() format and can be replayed with Game.apply().
+
+        The search is anytime: when the node or time budget runs out it
+        returns UNKNOWN with the line to the most advanced position seen
+        so far (most foundation cards, then fewest hidden cards).
+
+        It is a plain depth-first search, not iterative deepening or
+        best-first. Wins sit at the bottom of lines well over 50 searched
+        moves long, and the tree is too wide for shallow passes to finish.
+        In a trial of deals 0-29, iterative deepening from a 16-move limit
+        solved none in 100k nodes or in 200 ms, against 17 and 15 for this
+        search. The price is that a budget can run out under the first
+        root moves, so an UNKNOWN line follows the move ordering of
+        ordered_moves() rather than a comparison of all root moves.
+
+        Args:
+            game: Position to solve.
+            budget_ms: Optional wall-clock budget in milliseconds.
+        """
+        deadline = None
+        if budget_ms is not None:
+            deadline = time.perf_counter() + budget_ms / 1000
+        game = game.clone()
+        table = self.table
+        table.clear()
+        macros, autoplay = self.macros, self.autoplay
+        position_key = _KEY_FUNCTIONS[self.key]
+        # UndoRecords of each move on the current line; the first entry
+        # holds the safe plays made at the root
+        path = [game.autoplay_safe() if autoplay else []]
+        if game.foundations.is_complete():
+            return SolveResult(SOLVED, _line(path), 0, 0)
+
+        best_line, best_progress = _line(path), _progress(game)
+        table.add(position_key(game))
+        stack = [iter(ordered_moves(game, macros))]
+        nodes = 0
+        depth = 0
+        while stack:
+            action = next(stack[-1], None)
+            if action is None:
+                stack.pop()
+                _undo(game, path.pop())
+                continue
+
+            records = apply_legal(game, action)
+            if autoplay:
+                records += game.autoplay_safe()
+            nodes += 1
+            out_of_budget = nodes >= self.max_nodes or (
+                deadline is not None
+                and not nodes % _CLOCK_INTERVAL
+                and time.perf_counter() >= deadline
+            )
+            if game.foundations.is_complete():
+                path.append(records)
+                depth = max(depth, len(stack))
+                return SolveResult(SOLVED, _line(path), nodes, depth)
+            if table.add(position_key(game)):
+                _undo(game, records)
+                if out_of_budget:
+                    return SolveResult(UNKNOWN, best_line, nodes, depth)
+                continue
+            path.append(records)
+            stack.append(iter(ordered_moves(game, macros)))
+            depth = max(depth, len(stack) - 1)
+
+            progress = _progress(game)
+            if progress > best_progress:
+                best_line, best_progress = _line(path), progress
+            if out_of_budget:
+                return SolveResult(UNKNOWN, best_line, nodes, depth)
+
+        return SolveResult(UNSOLVABLE, best_line, nodes, depth)
+
+
+def solve(game: Game, budget_ms: float = 200, **options) -> SolveResult:
+    """Search game for at most budget_ms milliseconds; see Solver.solve().
+
+    Meant for interactive hints: it always returns within about the
+    budget, with a winning line (SOLVED), the best line found after
+    finding no win among the searched moves (UNSOLVABLE), or the best
+    line found so far (UNKNOWN). options are passed to Solver().
+    """
+    return Solver(**options).solve(game, budget_ms)
+
+
+def _progress(game: Game) -> int:
+    """Score how far a position has come: foundation cards, then revealed cards."""
+    foundation_cards = sum(len(pile) for pile in game.foundations.piles.values())
+    hidden = sum(len(pile.hidden_cards) for pile in game.tableau.piles)
+    return foundation_cards * 32 - hidden
+
+
+def _undo(game: Game, records: list[UndoRecord]) -> None:
+    for record in reversed(records):
+        game.undo(record)
+
+
+def _line(path: list[list[UndoRecord]]) -> list[tuple]:
+    """Flatten a search path into plain action tuples."""
+    return [record.action for records in path for record in records]
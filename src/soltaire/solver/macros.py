@@ -0,0 +1,63 @@
+"""Stock macro moves: draw until a card is on top of the waste, then play it.
+
+Under draw-3 every draw is its own search node, and most of them lead
+nowhere. Tableau moves never touch the talon, so any line can be
+reordered to do its draws right before the waste card they uncover is
+played. A search can then replace "draw" and the waste plays with one
+macro move per card in Talon.reachable() and destination:
+
+    ("stock_to_foundation", draws)
+    ("stock_to_tableau", draws, pile)
+
+draws is the number of draw actions to take first (0 plays the current
+waste top). expand() turns a macro back into plain action tuples.
+"""
+
+from soltaire.core.card import Card
+from soltaire.core.game_logic import Game, UndoRecord
+
+STOCK_TO_FOUNDATION = "stock_to_foundation"
+STOCK_TO_TABLEAU = "stock_to_tableau"
+
+_DRAW = ("draw",)
+_WASTE_TO_FOUNDATION = ("waste_to_foundation",)
+
+
+def stock_moves(
+    game: Game, reachable: list[tuple[Card, int]] | None = None
+) -> list[tuple]:
+    """Return the legal stock macro moves of game, fewest draws first.
+
+    Args:
+        game: Position to generate moves for.
+        reachable: game.talon.reachable(), if the caller already has it.
+    """
+    if reachable is None:
+        reachable = game.talon.reachable()
+    foundations = game.foundations
+    needs = game.tableau.needs_index()
+    moves = []
+    for card, draws in reachable:
+        if foundations.can_add_card(card):
+            moves.append((STOCK_TO_FOUNDATION, draws))
+        targets = needs[card.number * 2 + card.color]
+        while targets:
+            low = targets & -targets
+            moves.append((STOCK_TO_TABLEAU, draws, low.bit_length() - 1))
+            targets ^= low
+    return moves
+
+
+def expand(action: tuple) -> list[tuple]:
+    """Return the plain action tuples that make up action."""
+    kind = action[0]
+    if kind == STOCK_TO_FOUNDATION:
+        return [_DRAW] * action[1] + [_WASTE_TO_FOUNDATION]
+    if kind == STOCK_TO_TABLEAU:
+        return [_DRAW] * action[1] + [("waste_to_tableau", action[2])]
+    return [action]
+
+
+def apply_legal(game: Game, action: tuple) -> list[UndoRecord]:
+    """Apply a legal plain or macro action; undo the records in reverse order."""
+    return [game.apply_legal(step) for step in expand(action)]
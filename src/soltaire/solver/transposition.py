@@ -0,0 +1,33 @@
+"""Fixed-size transposition table for search."""
+
+
+class TranspositionTable:
+    """A set of 64-bit position keys with bounded memory.
+
+    Keys live in a direct-mapped array of 2**bits slots indexed by their
+    low bits. A key that lands on an occupied slot replaces the previous
+    one, so the table never grows; forgetting a position only costs the
+    search some repeated work, never a wrong answer.
+    """
+
+    def __init__(self, bits: int = 20):
+        self.mask = (1 << bits) - 1
+        self.slots: list[int] = [0] * (1 << bits)
+        self.stored = 0  # number of add() calls that wrote a new key
+
+    def add(self, key: int) -> bool:
+        """Store key; return True if it was already in the table."""
+        index = key & self.mask
+        if self.slots[index] == key:
+            return True
+        self.slots[index] = key
+        self.stored += 1
+        return False
+
+    def __contains__(self, key: int) -> bool:
+        return self.slots[key & self.mask] == key
+
+    def clear(self) -> None:
+        """Forget every stored key."""
+        self.slots = [0] * len(self.slots)
+        self.stored = 0
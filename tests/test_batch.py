@@ -0,0 +1,49 @@
+"""Tests for the numpy batch engine."""
+
+import numpy as np
+
+from soltaire.core.batch import GameBatch
+from soltaire.core.game_logic import Game
+from soltaire.core.state import GameState
+
+
+def test_batch_deals_match_game():
+    batch = GameBatch.from_deals([0, 1, 2])
+    for row, deal in enumerate([0, 1, 2]):
+        assert batch.state(row) == GameState.from_game(Game(deal=deal))
+
+
+def test_batch_follows_game_rules():
+    deals = list(range(16))
+    games = [Game(deal=deal) for deal in deals]
+    batch = GameBatch.from_deals(deals)
+    rng = np.random.default_rng(5)
+
+    for _ in range(400):
+        mask = batch.valid_action_mask()
+        actions = np.empty(len(games), dtype=np.intp)
+        for row, game in enumerate(games):
+            np.testing.assert_array_equal(mask[row], game.valid_action_mask())
+            actions[row] = rng.choice(np.flatnonzero(mask[row]))
+            game.apply_legal_id(int(actions[row]))
+        batch.step(actions)
+        for row, game in enumerate(games):
+            assert batch.state(row) == GameState.from_game(game)
+
+
+def test_negative_action_skips_game():
+    batch = GameBatch.from_deals([3, 4])
+    before = batch.state(1)
+    batch.step([0, -1])
+    assert batch.state(1) == before
+    assert batch.cursor[0] == 3
+
+
+def test_from_games_round_trip():
+    game = Game(deal=9)
+    for _ in range(5):
+        game.draw_cards()
+    batch = GameBatch.from_games([game])
+    assert batch.state(0) == GameState.from_game(game)
+    assert batch.to_game(0).state_hash == game.state_hash
+    assert batch.to_game(0).unseen_mask == game.unseen_mask
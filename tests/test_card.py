@@ -1,8 +1,11 @@
 """Tests for Card class."""
 
+import copy
+import pickle
+
 import pytest
 
-from soltaire.core.card import Card
+from soltaire.core.card import CARDS, SUITS, Card
 
 
 def test_card_creation():
@@ -27,3 +30,30 @@ def test_card_invalid_number():
 def test_card_invalid_suit():
     with pytest.raises(TypeError):
         Card(1, "Invalid")
+
+
+def test_card_zero_number():
+    with pytest.raises(IndexError):
+        Card(0, "Hearts")
+
+
+def test_cards_are_interned():
+    assert Card(1, "Hearts") is Card(1, "Hearts")
+    assert Card(12, "Spades") is CARDS[Card(12, "Spades").id]
+    assert len({Card(n, s) for s in SUITS for n in range(1, 14)}) == 52
+
+
+def test_card_ids_and_bits():
+    for card_id, card in enumerate(CARDS):
+        assert card.id == card_id
+        assert card.suit == SUITS[card.suit_index]
+        assert card.color == (1 if card.suit in ("Hearts", "Diamonds") else 0)
+    assert Card(1, "Hearts").id == 0
+    assert Card(13, "Spades").id == 51
+
+
+def test_card_copy_and_pickle_keep_identity():
+    card = Card(7, "Diamonds")
+    assert copy.copy(card) is card
+    assert copy.deepcopy([card])[0] is card
+    assert pickle.loads(pickle.dumps(card)) is card
@@ -167,3 +167,11 @@ def test_win_detection(cli):
         cli.game.foundations.piles[suit] = [Card(n, suit) for n in range(1, 14)]
 
     assert cli.game.foundations.is_complete() is True
+
+
+def test_hint_suggests_a_valid_move(cli):
+    cli.game = Game(deal=5)
+    valid = cli.game.get_valid_actions()
+    hint = cli._hint()
+    assert hint in valid
+    assert cli.parse_and_execute("h") is True
@@ -0,0 +1,44 @@
+"""Tests for deal generation by deal number."""
+
+import pytest
+
+from soltaire.core.card import CARDS
+from soltaire.core.deal import MAX_DEAL, deal_from_index
+from soltaire.core.game_logic import Game
+from soltaire.core.state import GameState
+
+
+def test_deal_is_a_permutation():
+    for index in (0, 1, 12345, MAX_DEAL - 1):
+        cards = deal_from_index(index)
+        assert len(cards) == 52
+        assert set(cards) == set(CARDS)
+
+
+def test_deal_is_reproducible():
+    assert deal_from_index(42) == deal_from_index(42)
+    deals = {tuple(deal_from_index(i)) for i in range(200)}
+    assert len(deals) == 200
+
+
+def test_deal_out_of_range():
+    with pytest.raises(ValueError):
+        deal_from_index(-1)
+    with pytest.raises(ValueError):
+        deal_from_index(MAX_DEAL)
+
+
+def test_game_replays_deal():
+    game = Game(deal=7)
+    assert game.deal == 7
+    assert GameState.from_game(game) == GameState.from_game(Game(deal=7))
+    assert GameState.from_game(game) != GameState.from_game(Game(deal=8))
+
+    game.draw_cards()
+    game.initialize_game(7)
+    assert GameState.from_game(game) == GameState.from_game(Game(deal=7))
+
+
+def test_random_game_records_its_deal():
+    game = Game()
+    assert GameState.from_game(game) == GameState.from_game(Game(deal=game.deal))
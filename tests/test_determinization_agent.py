@@ -0,0 +1,50 @@
+"""Tests for the determinization agent."""
+
+import pytest
+
+from soltaire.agents.determinization_agent import DeterminizationAgent
+from soltaire.core.game_logic import Game
+from soltaire.env import KlondikeEnv
+from soltaire.sim import play_deal
+
+
+def test_act_returns_valid_action_and_is_reproducible():
+    game = Game(deal=7)
+    chosen = []
+    for _ in range(2):
+        # Without a time budget the search is bounded by nodes alone
+        agent = DeterminizationAgent(width=3, budget_ms=None, max_nodes=500)
+        agent.reset(seed=7)
+        chosen.append(agent.act_game(game))
+    assert game.valid_action_mask()[chosen[0]]
+    assert chosen[0] == chosen[1]
+
+
+def test_plays_a_game():
+    agent = DeterminizationAgent(width=2, budget_ms=5, max_nodes=200)
+    agent.reset(seed=5)
+    game = Game(deal=5)
+    for _ in range(30):
+        if game.foundations.is_complete() or game.is_stuck():
+            break
+        game.apply_action_id(agent.act_game(game))
+
+
+def test_rejects_env_observations():
+    agent = DeterminizationAgent(width=2, budget_ms=5, max_nodes=200)
+    obs, _ = KlondikeEnv().reset(seed=5)
+    with pytest.raises(TypeError):
+        agent.act(obs)
+    with pytest.raises(TypeError):
+        play_deal(agent, 5, 10)
+
+
+def test_does_not_return_to_played_positions():
+    agent = DeterminizationAgent(width=2, budget_ms=None, max_nodes=200)
+    agent.reset(seed=0)
+    game = Game(deal=0)
+    seen = [game.state_hash]
+    for _ in range(60):
+        game.apply_legal_id(agent.act_game(game))
+        seen.append(game.state_hash)
+    assert len(set(seen)) == len(seen)
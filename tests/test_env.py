@@ -0,0 +1,89 @@
+"""Tests for KlondikeEnv."""
+
+import numpy as np
+import pytest
+
+from soltaire.core.actions import DRAW, NUM_ACTIONS
+from soltaire.core.game_logic import Game
+from soltaire.core.state import GameState
+from soltaire.env import FACE_DOWN, OBS_SIZE, KlondikeEnv
+from soltaire.env.solitaire_env import make_observation, write_observation
+
+
+def expected_observation(game):
+    """Encode game from scratch, as reset() does."""
+    obs = make_observation(np.zeros(OBS_SIZE, dtype=np.uint8))
+    write_observation(game, obs)
+    return obs
+
+
+def test_reset_encodes_the_deal():
+    env = KlondikeEnv()
+    obs, info = env.reset(seed=3)
+    game = Game(deal=3)
+    assert info == {"deal": 3}
+    assert GameState.from_game(env.game) == GameState.from_game(game)
+    assert list(obs["hidden"]) == list(range(7))
+    for i, pile in enumerate(game.tableau.piles):
+        assert list(obs["tableau"][i, :i]) == [FACE_DOWN] * i
+        assert obs["tableau"][i, i] == pile.visible_cards[0].id
+    assert not obs["foundations"].any()
+    assert np.array_equal(obs["action_mask"], game.valid_action_mask())
+
+
+def test_observation_stays_in_sync_and_reuses_the_buffer():
+    rng = np.random.default_rng(0)
+    for autoplay in (False, True):
+        env = KlondikeEnv(autoplay=autoplay)
+        obs, _ = env.reset(seed=11)
+        start = (int(obs["foundations"].sum()), int(obs["hidden"].sum()))
+        total = 0.0
+        for _ in range(300):
+            action = rng.choice(np.flatnonzero(obs["action_mask"]))
+            next_obs, reward, terminated, truncated, _ = env.step(action)
+            assert next_obs is obs
+            total += reward
+            expected = expected_observation(env.game)
+            for name, view in obs.items():
+                assert np.array_equal(view, expected[name]), name
+            if terminated or truncated:
+                break
+        assert np.shares_memory(obs["tableau"], env.buffer)
+        played = int(obs["foundations"].sum()) - start[0]
+        revealed = start[1] - int(obs["hidden"].sum())
+        won = env.game.foundations.is_complete()
+        assert total == played + 0.5 * revealed + (10 if won else 0)
+
+
+def test_step_rejects_illegal_action():
+    env = KlondikeEnv()
+    obs, _ = env.reset(seed=1)
+    illegal = int(np.flatnonzero(~obs["action_mask"])[0])
+    with pytest.raises(ValueError):
+        env.step(illegal)
+
+
+def test_step_rejects_out_of_range_ids():
+    env = KlondikeEnv()
+    env.reset(seed=1)
+    for action in (-NUM_ACTIONS, -1, NUM_ACTIONS):  # -NUM_ACTIONS would wrap to DRAW
+        with pytest.raises(ValueError):
+            env.step(action)
+    assert env.steps == 0
+
+
+def test_truncates_after_max_steps():
+    env = KlondikeEnv(max_steps=3)
+    env.reset(seed=2)
+    results = [env.step(DRAW) for _ in range(3)]
+    assert [truncated for *_, truncated, _ in results] == [False, False, True]
+
+
+def test_external_buffer_and_unseeded_resets():
+    buffer = np.zeros(OBS_SIZE, dtype=np.uint8)
+    env = KlondikeEnv(buffer=buffer)
+    env.reset(seed=8)
+    first = [env.reset()[1]["deal"] for _ in range(3)]
+    env.reset(seed=8)
+    assert [env.reset()[1]["deal"] for _ in range(3)] == first
+    assert buffer.any()
@@ -112,3 +112,20 @@ def test_is_complete(empty_foundations):
             empty_foundations.add_card_to_foundation(Card(i, suit))
 
     assert empty_foundations.is_complete()
+
+
+def test_is_safe_to_add(empty_foundations):
+    """Test the rule for foundation plays that can never hurt."""
+    for i in range(1, 3):
+        assert empty_foundations.is_safe_to_add(Card(i, "Hearts"))
+        empty_foundations.add_card_to_foundation(Card(i, "Hearts"))
+
+    # A black two could still need the red three until both are up
+    assert not empty_foundations.is_safe_to_add(Card(3, "Hearts"))
+    for suit in ["Clubs", "Spades"]:
+        for i in range(1, 3):
+            empty_foundations.add_card_to_foundation(Card(i, suit))
+    assert empty_foundations.is_safe_to_add(Card(3, "Hearts"))
+
+    # Not playable at all
+    assert not empty_foundations.is_safe_to_add(Card(5, "Hearts"))
@@ -0,0 +1,380 @@
+"""Tests for the Game class."""
+
+import random
+
+import numpy as np
+import pytest
+
+from soltaire.core.actions import (
+    ACTION_IDS,
+    ACTION_TABLE,
+    NUM_ACTIONS,
+    tableau_to_tableau_id,
+)
+from soltaire.core.card import SUITS
+from soltaire.core.game_logic import Game
+from soltaire.core.state import GameState
+from soltaire.core.zobrist import compute_hash
+
+
+def random_action(game, rng):
+    """Pick a random legal action tuple, including foundation-to-tableau moves."""
+    actions = game.get_valid_actions()
+    for suit in SUITS:
+        card = game.foundations.peek_top_card(suit)
+        if card is None:
+            continue
+        for pile in range(7):
+            if game.tableau.can_add_card_to_pile(card, pile):
+                actions.append(("foundation_to_tableau", suit, pile))
+    return rng.choice(actions)
+
+
+def random_move(game, rng):
+    """Play one random legal move through draw_cards() and the move_* methods."""
+    action = random_action(game, rng)
+    kind = action[0]
+    if kind == "draw":
+        game.draw_cards()
+    elif kind == "waste_to_foundation":
+        game.move_waste_to_foundation()
+    elif kind == "waste_to_tableau":
+        game.move_waste_to_tableau(action[1])
+    elif kind == "tableau_to_foundation":
+        game.move_tableau_to_foundation(action[1])
+    elif kind == "foundation_to_tableau":
+        game.move_foundation_to_tableau(action[1], action[2])
+    else:
+        game.move_tableau_to_tableau(*action[1:])
+
+
+# ---------------------------------------------------------------------------
+# State hash
+# ---------------------------------------------------------------------------
+
+
+def test_state_hash_matches_recomputation():
+    rng = random.Random(3)
+    for deal in range(10):
+        game = Game(deal=deal)
+        assert game.state_hash == compute_hash(game)
+        for _ in range(300):
+            random_move(game, rng)
+            assert game.state_hash == compute_hash(game)
+
+
+def test_state_hash_matches_recomputation_through_apply():
+    rng = random.Random(13)
+    for deal in range(10):
+        game = Game(deal=deal)
+        for _ in range(300):
+            game.apply(random_action(game, rng))
+            assert game.state_hash == compute_hash(game)
+
+
+def test_state_hash_survives_state_round_trip():
+    rng = random.Random(4)
+    game = Game(deal=4)
+    for _ in range(100):
+        game.apply(random_action(game, rng))
+    restored = GameState.from_game(game).to_game()
+    assert restored.state_hash == game.state_hash
+
+
+def test_state_hash_distinguishes_hand_and_waste():
+    game = Game(deal=0)
+    before = game.state_hash
+    game.draw_cards()
+    assert game.state_hash != before
+
+
+# ---------------------------------------------------------------------------
+# Apply / undo
+# ---------------------------------------------------------------------------
+
+
+def test_undo_restores_every_position():
+    rng = random.Random(5)
+    for deal in range(10):
+        game = Game(deal=deal)
+        history = []
+        for _ in range(250):
+            before = (GameState.from_game(game), game.state_hash)
+            record = game.apply(random_action(game, rng))
+            if rng.random() < 0.3:
+                game.undo(record)
+                assert (GameState.from_game(game), game.state_hash) == before
+            else:
+                history.append((before, record))
+
+        while history:
+            (state, state_hash), record = history.pop()
+            game.undo(record)
+            assert GameState.from_game(game) == state
+            assert game.state_hash == state_hash == compute_hash(game)
+
+
+def test_failed_probes_leave_game_untouched():
+    game = Game(deal=0)
+    before = (GameState.from_game(game), game.state_hash)
+    probes = [
+        ("tableau_to_tableau", 0, 0, 1),
+        ("tableau_to_tableau", 0, 1, 0),
+        ("tableau_to_tableau", 0, 1, 5),
+        ("tableau_to_tableau", -1, 1, 1),
+        ("waste_to_tableau", 9),
+        ("foundation_to_tableau", "Hearts", 0),
+        ("foundation_to_tableau", "Stars", 0),
+        ("bogus",),
+    ]
+    for action in probes:
+        assert not game.is_legal(action)
+    assert not game.move_tableau_to_tableau(0, 1, 0)
+    assert not game.move_foundation_to_tableau("Hearts", 3)
+    assert (GameState.from_game(game), game.state_hash) == before
+
+
+def test_apply_rejects_illegal_action():
+    game = Game(deal=0)
+    game.waste.cards = []
+    with pytest.raises(ValueError):
+        game.apply(("waste_to_foundation",))
+
+
+# ---------------------------------------------------------------------------
+# Clone
+# ---------------------------------------------------------------------------
+
+
+def test_clone_is_independent():
+    rng = random.Random(6)
+    game = Game(deal=6)
+    for _ in range(50):
+        game.apply(random_action(game, rng))
+    original = GameState.from_game(game)
+
+    clones = [game.clone() for _ in range(5)]
+    for clone in clones:
+        assert GameState.from_game(clone) == original
+        assert clone.state_hash == game.state_hash
+        for _ in range(100):
+            clone.apply(random_action(clone, rng))
+            assert clone.state_hash == compute_hash(clone)
+        assert GameState.from_game(game) == original
+
+    clone_states = [GameState.from_game(clone) for clone in clones]
+    for _ in range(100):
+        game.apply(random_action(game, rng))
+    assert game.state_hash == compute_hash(game)
+    assert [GameState.from_game(clone) for clone in clones] == clone_states
+
+
+def test_clone_shares_untouched_piles():
+    game = Game(deal=0)
+    clone = game.clone()
+    assert clone.talon.slots is game.talon.slots
+    clone.draw_cards()
+    for pile, twin in zip(game.tableau.piles, clone.tableau.piles):
+        assert twin.hidden_cards is pile.hidden_cards
+        assert twin.visible_cards is pile.visible_cards
+    assert clone.talon.slots is not game.talon.slots
+
+
+# ---------------------------------------------------------------------------
+# Move generation
+# ---------------------------------------------------------------------------
+
+
+def reference_valid_actions(game):
+    """The original exhaustive move generator, kept as an oracle."""
+    actions = []
+    if game.hand.cards or game.waste.cards:
+        actions.append(("draw",))
+    if game.waste.cards:
+        card = game.waste.peek_top_card()
+        if game.foundations.can_add_card(card):
+            actions.append(("waste_to_foundation",))
+        for i in range(7):
+            if game.tableau.can_add_card_to_pile(card, i):
+                actions.append(("waste_to_tableau", i))
+    for from_pile in range(7):
+        visible = game.tableau.piles[from_pile].get_visible_cards()
+        if not visible:
+            continue
+        if game.foundations.can_add_card(visible[-1]):
+            actions.append(("tableau_to_foundation", from_pile))
+        for count in range(1, len(visible) + 1):
+            cards = game.tableau.get_cards_from_pile(from_pile, count)
+            for to_pile in range(7):
+                if to_pile != from_pile and game.tableau.can_add_cards_to_pile(
+                    cards, to_pile
+                ):
+                    actions.append(("tableau_to_tableau", from_pile, to_pile, count))
+    return actions
+
+
+def test_valid_actions_match_reference():
+    rng = random.Random(8)
+    for deal in range(20):
+        game = Game(deal=deal)
+        for _ in range(300):
+            assert game.get_valid_actions() == reference_valid_actions(game)
+            game.apply(random_action(game, rng))
+
+
+# ---------------------------------------------------------------------------
+# Integer actions
+# ---------------------------------------------------------------------------
+
+
+def test_action_table_round_trip():
+    assert len(ACTION_TABLE) == NUM_ACTIONS
+    for action_id, action in enumerate(ACTION_TABLE):
+        assert ACTION_IDS[action] == action_id
+        if action[0] == "tableau_to_tableau":
+            assert tableau_to_tableau_id(*action[1:]) == action_id
+
+
+def test_valid_action_mask_matches_actions():
+    rng = random.Random(9)
+    mask = np.zeros(NUM_ACTIONS, dtype=bool)
+    for deal in range(10):
+        game = Game(deal=deal)
+        for _ in range(300):
+            assert game.valid_action_mask(out=mask) is mask
+            legal = game.get_valid_actions()
+            for suit in SUITS:
+                card = game.foundations.peek_top_card(suit)
+                for pile in range(7):
+                    if card and game.tableau.can_add_card_to_pile(card, pile):
+                        legal.append(("foundation_to_tableau", suit, pile))
+            assert set(np.flatnonzero(mask)) == {ACTION_IDS[a] for a in legal}
+
+            action_id = int(rng.choice(np.flatnonzero(mask)))
+            game.apply_action_id(action_id)
+
+
+def reference_is_stuck(game):
+    """The original scan-based stuck check, kept as an oracle."""
+    tableau, foundations = game.tableau, game.foundations
+    for pile in tableau.piles:
+        if pile.visible_cards and foundations.can_add_card(pile.visible_cards[-1]):
+            return False
+    if game.waste.cards and foundations.can_add_card(game.waste.peek_top_card()):
+        return False
+    for i, pile in enumerate(tableau.piles):
+        if pile.hidden_cards and pile.visible_cards:
+            for j in range(7):
+                if j != i and tableau.can_add_cards_to_pile(pile.visible_cards, j):
+                    return False
+    for i, pile in enumerate(tableau.piles):
+        visible = pile.visible_cards
+        for count in range(1, len(visible)):
+            if foundations.can_add_card(visible[-(count + 1)]):
+                for j in range(7):
+                    if j != i and tableau.can_add_cards_to_pile(visible[-count:], j):
+                        return False
+    if game.waste.cards:
+        for i in range(7):
+            if tableau.can_add_card_to_pile(game.waste.peek_top_card(), i):
+                return False
+    if not game.hand.cards and not game.waste.cards:
+        return True
+    if not game.waste.cards:
+        return False
+    return game._no_progress
+
+
+def test_is_stuck_matches_reference():
+    rng = random.Random(10)
+    for deal in range(20):
+        game = Game(deal=deal)
+        for _ in range(300):
+            assert game.is_stuck() == reference_is_stuck(game)
+            game.apply(random_action(game, rng))
+
+
+# ---------------------------------------------------------------------------
+# Safe autoplay
+# ---------------------------------------------------------------------------
+
+
+def test_autoplay_safe_plays_only_safe_cards():
+    rng = random.Random(14)
+    for deal in range(10):
+        game = Game(deal=deal)
+        for _ in range(rng.randint(0, 200)):
+            game.apply(random_action(game, rng))
+        before = game.state_hash
+        records = game.autoplay_safe()
+        for record in records:
+            assert record.action[0] == "tableau_to_foundation"
+        for pile in game.tableau.piles:
+            if pile.visible_cards:
+                assert not game.foundations.is_safe_to_add(pile.visible_cards[-1])
+        assert game.state_hash == compute_hash(game)
+
+        for record in reversed(records):
+            game.undo(record)
+        assert game.state_hash == before
+
+
+# ---------------------------------------------------------------------------
+# Unseen cards
+# ---------------------------------------------------------------------------
+
+
+def _mask(cards):
+    return sum(1 << card.id for card in cards)
+
+
+def test_unseen_mask_tracks_flips_and_draws():
+    rng = random.Random(15)
+    for deal in range(10):
+        game = Game(deal=deal)
+        seen = 0
+        history = []
+        for _ in range(250):
+            for pile in game.tableau.piles:
+                seen |= _mask(pile.visible_cards)
+            seen |= _mask(game.talon.waste_cards())
+            hidden = _mask(c for pile in game.tableau.piles for c in pile.hidden_cards)
+            stock = _mask(game.talon.stock_cards())
+            assert game.unseen_mask == (hidden | stock) & ~seen
+            history.append((game.unseen_mask, game.apply(random_action(game, rng))))
+
+        while history:
+            unseen, record = history.pop()
+            game.undo(record)
+            assert game.unseen_mask == unseen
+
+
+def test_determinize_keeps_seen_cards_and_deals_unseen_ones():
+    rng = random.Random(16)
+    for deal in range(10):
+        game = Game(deal=deal)
+        for _ in range(rng.randint(0, 150)):
+            game.apply(random_action(game, rng))
+        original = GameState.from_game(game)
+        sample = game.determinize(rng)
+
+        assert GameState.from_game(game) == original
+        assert sample.state_hash == compute_hash(sample)
+        assert sample.unseen_mask == game.unseen_mask
+        for pile, twin in zip(game.tableau.piles, sample.tableau.piles):
+            assert twin.visible_cards == pile.visible_cards
+            assert len(twin.hidden_cards) == len(pile.hidden_cards)
+        assert sample.talon.waste_cards() == game.talon.waste_cards()
+        dealt = [c for pile in sample.tableau.piles for c in pile.hidden_cards]
+        for card, twin in zip(game.talon.stock_cards(), sample.talon.stock_cards()):
+            if game.unseen_mask >> card.id & 1:
+                dealt.append(twin)
+            else:
+                assert twin is card
+        assert _mask(dealt) == game.unseen_mask and len(dealt) == len(set(dealt))
+
+
+def test_determinize_shuffles():
+    game = Game(deal=1)
+    samples = {GameState.from_game(game.determinize(random.Random(i))) for i in range(5)}
+    assert len(samples) == 5
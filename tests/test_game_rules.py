@@ -1,7 +1,9 @@
 """Tests for game rules module."""
 
-from soltaire.core.card import Card
+from soltaire.core.card import CARDS, Card
 from soltaire.core.game_rules import (
+    CAN_FOUNDATION,
+    CAN_STACK,
     is_ascending,
     is_descending,
     is_different_color,
@@ -96,3 +98,25 @@ def test_is_valid_foundation_move():
     # Invalid moves
     assert is_valid_foundation_move(three_hearts, ace_hearts) is False  # Skip 2
     assert is_valid_foundation_move(two_spades, ace_hearts) is False  # Wrong suit
+
+
+def test_can_stack_table():
+    """Test the tableau lookup table against the rule functions."""
+    for moving in CARDS:
+        for target in CARDS:
+            expected = is_different_color(moving, target) and is_descending(
+                moving, target
+            )
+            assert CAN_STACK[moving.id * 52 + target.id] is expected
+            assert is_valid_tableau_move(moving, target) is expected
+
+
+def test_can_foundation_table():
+    """Test the foundation lookup table against is_valid_foundation_move."""
+    for card in CARDS:
+        assert CAN_FOUNDATION[card.id * 14] is is_valid_foundation_move(card, None)
+        for height in range(1, 14):
+            top = Card(height, card.suit)
+            assert CAN_FOUNDATION[card.id * 14 + height] is is_valid_foundation_move(
+                card, top
+            )
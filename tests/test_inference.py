@@ -0,0 +1,79 @@
+"""Tests for the batched inference server."""
+
+import numpy as np
+import pytest
+
+from soltaire.agents.base import BaseAgent
+from soltaire.core.actions import DRAW
+from soltaire.env import KlondikeEnv
+from soltaire.sim import serve_games
+
+
+class MaskAgent(BaseAgent):
+    """Plays the lowest valid action id that is not a draw, else draws."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def act(self, obs) -> int:
+        mask = obs["action_mask"].copy()
+        mask[DRAW] = mask[DRAW] and not mask[DRAW + 1 :].any()
+        return int(np.argmax(mask))
+
+    def act_batch(self, obs):
+        self.batch_sizes.append(len(obs["action_mask"]))
+        return super().act_batch(obs)
+
+
+def play(agent, deal, max_moves):
+    env = KlondikeEnv(max_steps=max_moves)
+    obs, _ = env.reset(seed=deal)
+    moves = 0
+    while True:
+        obs, _, terminated, truncated, _ = env.step(agent.act(obs))
+        moves += 1
+        if terminated or truncated:
+            return moves, int(obs["foundations"].sum())
+
+
+def test_serve_games_matches_sequential_play():
+    agent = MaskAgent()
+    results = list(serve_games(agent, range(6), actors=3, max_moves=60))
+    assert sorted(result.deal for result in results) == list(range(6))
+    for result in results:
+        assert (result.moves, result.foundation_cards) == play(
+            MaskAgent(), result.deal, 60
+        )
+        assert result.won == (result.foundation_cards == 52)
+    assert max(agent.batch_sizes) == 3
+    assert sum(agent.batch_sizes) == sum(result.moves for result in results)
+
+
+def test_serve_games_caps_batch_size():
+    agent = MaskAgent()
+    list(serve_games(agent, range(3), actors=3, max_batch=2, max_moves=20))
+    assert max(agent.batch_sizes) <= 2
+
+
+def test_default_act_batch_calls_act_per_row():
+    env = KlondikeEnv()
+    obs, _ = env.reset(seed=4)
+    batch = {name: np.stack([view, view]) for name, view in obs.items()}
+    agent = MaskAgent()
+    assert list(BaseAgent.act_batch(agent, batch)) == [agent.act(obs)] * 2
+
+
+def test_serve_games_with_no_deals():
+    assert list(serve_games(MaskAgent(), range(0))) == []
+
+
+class BrokenAgent(BaseAgent):
+    """Answers every request with an action id that does not exist."""
+
+    def act(self, obs) -> int:
+        return -1
+
+
+def test_serve_games_raises_when_an_actor_dies():
+    with pytest.raises(RuntimeError, match="exited with code"):
+        list(serve_games(BrokenAgent(), range(2), actors=2, max_moves=20))
@@ -0,0 +1,34 @@
+"""Tests for RandomAgent."""
+
+import numpy as np
+
+from soltaire.agents.random_agent import RandomAgent, sample_masked
+from soltaire.env import KlondikeEnv
+from soltaire.sim import play_deal
+
+
+def test_sample_masked_picks_valid_entries_uniformly():
+    masks = np.zeros((4000, 10), dtype=bool)
+    masks[:, [1, 4, 9]] = True
+    masks[0] = False
+    masks[1, 7] = True  # a row with a different set of entries
+    masks[1, [1, 4, 9]] = False
+    chosen = sample_masked(masks, np.random.default_rng(0))
+    assert chosen[0] == 0 and chosen[1] == 7
+    assert set(chosen[2:]) == {1, 4, 9}
+    counts = np.bincount(chosen[2:], minlength=10)[[1, 4, 9]]
+    assert counts.min() > 1200
+
+
+def test_act_batch_returns_valid_actions():
+    envs = [KlondikeEnv() for _ in range(5)]
+    obs = [env.reset(seed=i)[0] for i, env in enumerate(envs)]
+    batch = {name: np.stack([o[name] for o in obs]) for name in obs[0]}
+    actions = RandomAgent(seed=1).act_batch(batch)
+    assert actions.shape == (5,)
+    assert batch["action_mask"][np.arange(5), actions].all()
+
+
+def test_plays_reproducibly():
+    agent = RandomAgent()
+    assert play_deal(agent, 3, 200)[:4] == play_deal(agent, 3, 200)[:4]
@@ -0,0 +1,60 @@
+"""Tests for the simulation runner."""
+
+import numpy as np
+
+from soltaire.agents.base import BaseAgent
+from soltaire.sim import GameResult, play_deal, run_games
+
+
+class FirstActionAgent(BaseAgent):
+    """Plays the lowest valid action id that is not a draw, else draws.
+
+    With prefer_draw=True it plays the lowest valid id instead, which is
+    the draw whenever drawing is legal.
+    """
+
+    def __init__(self, prefer_draw: bool = False):
+        self.prefer_draw = prefer_draw
+        self.seeds = []
+
+    def act(self, obs) -> int:
+        valid = np.flatnonzero(obs["action_mask"])
+        if self.prefer_draw or len(valid) == 1:
+            return int(valid[0])
+        return int(valid[1]) if valid[0] == 0 else int(valid[0])
+
+    def reset(self, seed=None):
+        self.seeds.append(seed)
+
+
+def test_play_deal_reports_result():
+    agent = FirstActionAgent()
+    result = play_deal(agent, 5, max_moves=50)
+    assert isinstance(result, GameResult)
+    assert result.deal == 5
+    assert 0 < result.moves <= 50
+    assert 0 <= result.foundation_cards <= 52
+    assert result.won == (result.foundation_cards == 52)
+    assert agent.seeds == [5]
+
+
+def test_play_deal_is_reproducible():
+    first = play_deal(FirstActionAgent(), 11, max_moves=200)
+    second = play_deal(FirstActionAgent(), 11, max_moves=200)
+    assert first[:4] == second[:4]
+
+
+def test_run_games_covers_every_deal():
+    results = list(run_games(FirstActionAgent, range(10, 30), workers=1, chunk_size=6))
+    assert sorted(r.deal for r in results) == list(range(10, 30))
+
+
+def test_run_games_in_worker_processes():
+    deals = range(0, 12)
+    kwargs = {"prefer_draw": True}
+    serial = list(run_games(FirstActionAgent, deals, workers=1, agent_kwargs=kwargs))
+    parallel = list(
+        run_games(FirstActionAgent, deals, workers=2, chunk_size=4, agent_kwargs=kwargs)
+    )
+    by_deal = {r.deal: r[:4] for r in parallel}
+    assert by_deal == {r.deal: r[:4] for r in serial}
@@ -0,0 +1,99 @@
+"""Tests for the Klondike solver."""
+
+import time
+
+import pytest
+
+from soltaire.core.game_logic import Game
+from soltaire.solver import SOLVED, UNKNOWN, Solver, TranspositionTable, solve
+from soltaire.solver.macros import STOCK_TO_TABLEAU, apply_legal, expand, stock_moves
+
+
+def test_solution_replays_to_a_win():
+    game = Game(deal=5)
+    result = Solver(max_nodes=50_000).solve(game)
+    assert result.status == SOLVED
+    for action in result.moves:
+        game.apply(action)
+    assert game.foundations.is_complete()
+
+
+def test_solution_without_macros():
+    game = Game(deal=6)
+    result = Solver(max_nodes=50_000, macros=False).solve(game)
+    assert result.status == SOLVED
+    for action in result.moves:
+        game.apply(action)
+    assert game.foundations.is_complete()
+
+
+def test_stock_moves_play_reachable_cards():
+    game = Game(deal=2)
+    for _ in range(4):
+        game.draw_cards()
+    reachable = dict(game.talon.reachable())
+    moves = stock_moves(game)
+    assert moves
+    for move in moves:
+        twin = game.clone()
+        draws = move[1]
+        steps = expand(move)
+        assert steps[:draws] == [("draw",)] * draws
+        for step in steps[:-1]:
+            twin.apply(step)
+        card = twin.talon.waste_top()
+        assert reachable[card] == draws
+        if move[0] == STOCK_TO_TABLEAU:
+            assert steps[-1] == ("waste_to_tableau", move[2])
+        twin.apply(steps[-1])
+
+        records = apply_legal(game.clone(), move)
+        assert len(records) == draws + 1
+
+
+def test_solve_leaves_game_untouched():
+    game = Game(deal=3)
+    before = game.state_hash
+    Solver(max_nodes=2_000).solve(game)
+    assert game.state_hash == before
+
+
+def test_node_budget_returns_best_line():
+    game = Game(deal=0)
+    result = Solver(max_nodes=200).solve(game)
+    assert result.status == UNKNOWN
+    assert result.nodes == 200
+    assert 0 < result.depth <= result.nodes
+    hidden = sum(len(pile.hidden_cards) for pile in game.tableau.piles)
+    for action in result.moves:
+        game.apply(action)
+    assert sum(len(pile.hidden_cards) for pile in game.tableau.piles) < hidden
+
+
+def test_budget_checks_run_on_transposition_hits():
+    for max_nodes in range(100, 1_000, 53):
+        result = Solver(max_nodes=max_nodes).solve(Game(deal=0))
+        assert result.status != UNKNOWN or result.nodes == max_nodes
+
+
+def test_solve_respects_time_budget():
+    start = time.perf_counter()
+    result = solve(Game(deal=0), budget_ms=50)
+    assert time.perf_counter() - start < 0.5
+    assert result.status == UNKNOWN
+    assert result.moves
+
+
+def test_unknown_key_mode():
+    with pytest.raises(ValueError):
+        Solver(key="zobrist")
+
+
+def test_transposition_table_is_bounded():
+    table = TranspositionTable(bits=4)
+    assert not table.add(5)
+    assert table.add(5)
+    assert 5 in table
+    assert not table.add(5 + 16)  # same slot, replaces 5
+    assert 5 not in table
+    assert len(table.slots) == 16
@@ -0,0 +1,69 @@
+"""Tests for the compact GameState encoding."""
+
+import random
+
+import pytest
+
+from soltaire.core.game_logic import Game
+from soltaire.core.state import STATE_SIZE, GameState
+
+
+def snapshot(game):
+    """Plain-list view of every zone, for comparing two games."""
+    return (
+        [(p.hidden_cards.copy(), p.visible_cards.copy()) for p in game.tableau.piles],
+        {suit: pile.copy() for suit, pile in game.foundations.piles.items()},
+        game.hand.cards.copy(),
+        game.waste.cards.copy(),
+        game._no_progress,
+    )
+
+
+def play_random(game, rng, steps):
+    """Yield the game after each of up to `steps` random valid actions."""
+    for _ in range(steps):
+        actions = game.get_valid_actions()
+        if not actions:
+            return
+        action = rng.choice(actions)
+        kind = action[0]
+        if kind == "draw":
+            game.draw_cards()
+        elif kind == "waste_to_foundation":
+            game.move_waste_to_foundation()
+        elif kind == "waste_to_tableau":
+            game.move_waste_to_tableau(action[1])
+        elif kind == "tableau_to_foundation":
+            game.move_tableau_to_foundation(action[1])
+        else:
+            game.move_tableau_to_tableau(*action[1:])
+        yield game
+
+
+def test_state_has_fixed_size():
+    state = GameState.from_game(Game(deal=0))
+    assert len(bytes(state)) == STATE_SIZE
+
+
+def test_round_trip_through_play():
+    rng = random.Random(7)
+    for deal in range(5):
+        game = Game(deal=deal)
+        for game in play_random(game, rng, 200):
+            state = GameState.from_game(game)
+            restored = state.to_game()
+            assert snapshot(restored) == snapshot(game)
+            assert restored.unseen_mask == game.unseen_mask
+            assert GameState.from_game(restored) == state
+            assert restored.get_valid_actions() == game.get_valid_actions()
+
+
+def test_int_round_trip():
+    state = GameState.from_game(Game(deal=0))
+    assert GameState.from_int(state.to_int()) == state
+    assert hash(GameState.from_int(state.to_int())) == hash(state)
+
+
+def test_wrong_size_rejected():
+    with pytest.raises(ValueError):
+        GameState(b"\x00" * (STATE_SIZE - 1))
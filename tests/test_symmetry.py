@@ -0,0 +1,71 @@
+"""Tests for symmetry-canonical position keys."""
+
+import random
+
+from soltaire.core.card import CARDS
+from soltaire.core.game_logic import Game
+from soltaire.core.state import (
+    CARDS_OFFSET,
+    FOUNDATION_OFFSET,
+    HIDDEN_OFFSET,
+    LENGTH_OFFSET,
+    TALON_LENGTH_OFFSET,
+    GameState,
+)
+from soltaire.core.symmetry import canonical_key
+from soltaire.solver import KEY_CANONICAL, SOLVED, Solver
+
+
+def relabel(game, suit_perm, pile_order):
+    """Return game with its suits permuted and its piles reordered."""
+    data = bytearray(GameState.from_game(game).data)
+    card_map = [suit_perm[card.suit_index] * 13 + card.number - 1 for card in CARDS]
+
+    piles = []
+    pos = CARDS_OFFSET
+    for i in range(7):
+        length = data[LENGTH_OFFSET + i]
+        piles.append((data[HIDDEN_OFFSET + i], data[pos : pos + length]))
+        pos += length
+    talon = data[pos : pos + data[TALON_LENGTH_OFFSET]]
+    heights = data[FOUNDATION_OFFSET : FOUNDATION_OFFSET + 4]
+
+    out = bytearray(data)
+    pos = CARDS_OFFSET
+    for i, source in enumerate(pile_order):
+        hidden, ids = piles[source]
+        out[HIDDEN_OFFSET + i] = hidden
+        out[LENGTH_OFFSET + i] = len(ids)
+        out[pos : pos + len(ids)] = bytes(card_map[c] for c in ids)
+        pos += len(ids)
+    out[pos : pos + len(talon)] = bytes(card_map[c] for c in talon)
+    for s in range(4):
+        out[FOUNDATION_OFFSET + suit_perm[s]] = heights[s]
+    return GameState(bytes(out)).to_game()
+
+
+def test_equivalent_positions_share_a_key():
+    rng = random.Random(17)
+    game = Game(deal=4)
+    for _ in range(40):
+        actions = game.get_valid_actions()
+        game.apply(rng.choice(actions))
+        for suit_perm in ((1, 0, 2, 3), (0, 1, 3, 2), (1, 0, 3, 2)):
+            order = list(range(7))
+            rng.shuffle(order)
+            twin = relabel(game, suit_perm, order)
+            assert canonical_key(twin) == canonical_key(game)
+
+
+def test_different_positions_have_different_keys():
+    keys = {canonical_key(Game(deal=deal)) for deal in range(50)}
+    assert len(keys) == 50
+
+
+def test_solver_with_canonical_keys():
+    game = Game(deal=5)
+    result = Solver(max_nodes=50_000, key=KEY_CANONICAL).solve(game)
+    assert result.status == SOLVED
+    for action in result.moves:
+        game.apply(action)
+    assert game.foundations.is_complete()
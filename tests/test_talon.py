@@ -0,0 +1,124 @@
+"""Tests for the cursor-based Talon behind Hand and Waste."""
+
+import random
+
+from soltaire.core.card import CARDS
+from soltaire.core.hand import Hand
+from soltaire.core.talon import Talon
+from soltaire.core.waste import Waste
+
+
+class ListTalon:
+    """Plain-list model of the hand/waste rules Talon has to reproduce."""
+
+    def __init__(self, stock):
+        self.stock = list(stock)
+        self.waste = []
+
+    def draw(self):
+        drawn = self.stock[-3:]
+        del self.stock[-3:]
+        self.waste.extend(drawn)
+        return drawn
+
+    def recycle(self):
+        self.stock = self.waste[::-1] + self.stock
+        self.waste = []
+
+
+def test_talon_matches_list_model():
+    rng = random.Random(11)
+    for _ in range(50):
+        cards = rng.sample(CARDS, 24)
+        talon, model = Talon(stock=cards), ListTalon(cards)
+        for _ in range(200):
+            roll = rng.random()
+            if roll < 0.5:
+                if model.stock:
+                    assert talon.draw() == model.draw()
+                else:
+                    talon.recycle()
+                    model.recycle()
+            elif model.waste:
+                assert talon.play() == model.waste.pop()
+
+            assert talon.stock_cards() == model.stock
+            assert talon.waste_cards() == model.waste
+            assert talon.visible_waste() == model.waste[-3:]
+            assert talon.waste_top() == (model.waste[-1] if model.waste else None)
+            assert talon.stock_count == len(model.stock)
+            assert talon.waste_count == len(model.waste)
+
+
+def test_undo_operations():
+    rng = random.Random(12)
+    cards = rng.sample(CARDS, 24)
+    talon = Talon(stock=cards)
+    for _ in range(100):
+        before = (talon.stock_cards(), talon.waste_cards())
+        if talon.stock_count:
+            drawn = talon.draw()
+            talon.undraw(len(drawn))
+            assert (talon.stock_cards(), talon.waste_cards()) == before
+            talon.draw()
+        else:
+            talon.recycle()
+            talon.unrecycle()
+            assert (talon.stock_cards(), talon.waste_cards()) == before
+            talon.recycle()
+        if talon.waste_count and rng.random() < 0.4:
+            before = (talon.stock_cards(), talon.waste_cards())
+            card = talon.play()
+            talon.unplay(card)
+            assert (talon.stock_cards(), talon.waste_cards()) == before
+            talon.play()
+
+
+def test_clone_is_copy_on_write():
+    talon = Talon(stock=list(CARDS[:10]))
+    twin = talon.clone()
+    twin.draw()
+    assert talon.waste_cards() == []
+    assert twin.waste_cards() == list(CARDS[7:10])
+    assert talon.stock_cards() == list(CARDS[:10])
+
+
+def test_shared_hand_and_waste_views():
+    talon = Talon(stock=list(CARDS[:5]))
+    hand, waste = Hand.view(talon), Waste.view(talon)
+    drawn = hand.draw_cards()
+    assert waste.cards == drawn
+    assert len(hand.cards) == 2
+
+    waste.cards = [CARDS[40]]
+    assert waste.peek_top_card() is CARDS[40]
+    assert hand.cards == list(CARDS[:2])
+
+
+def test_reachable_matches_drawing():
+    rng = random.Random(13)
+    for _ in range(30):
+        cards = rng.sample(CARDS, rng.randint(0, 24))
+        talon = Talon(stock=cards)
+        for _ in range(rng.randint(0, 12)):
+            if talon.stock_count or talon.waste_count:
+                if talon.stock_count:
+                    talon.draw()
+                else:
+                    talon.recycle()
+            if talon.waste_count and rng.random() < 0.3:
+                talon.play()
+
+        expected = {}
+        model = talon.clone()
+        if model.waste_top() is not None:
+            expected[model.waste_top()] = 0
+        for draws in range(1, 60):
+            if model.stock_count:
+                model.draw()
+            else:
+                model.recycle()
+            top = model.waste_top()
+            if top is not None:
+                expected.setdefault(top, draws)
+        assert talon.reachable() == sorted(expected.items(), key=lambda item: item[1])
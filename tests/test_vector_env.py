@@ -0,0 +1,94 @@
+"""Tests for VectorKlondikeEnv."""
+
+import numpy as np
+import pytest
+
+from soltaire.core.actions import DRAW
+from soltaire.env import SHARED_MEMORY, SYNC, KlondikeEnv, VectorKlondikeEnv
+
+
+def run(vector_env, steps, rng_seed=0):
+    """Play random legal actions; return every observation and result."""
+    rng = np.random.default_rng(rng_seed)
+    obs, info = vector_env.reset(seed=40)
+    history = [({k: v.copy() for k, v in obs.items()}, info["deal"].copy())]
+    for _ in range(steps):
+        actions = [rng.choice(np.flatnonzero(mask)) for mask in obs["action_mask"]]
+        obs, rewards, terminated, truncated, info = vector_env.step(actions)
+        history.append(
+            (
+                {k: v.copy() for k, v in obs.items()},
+                info["deal"].copy(),
+                rewards.copy(),
+                terminated.copy(),
+                truncated.copy(),
+            )
+        )
+    return history
+
+
+def test_sync_matches_single_envs():
+    vector_env = VectorKlondikeEnv(3, mode=SYNC)
+    obs, info = vector_env.reset(seed=40)
+    envs = [KlondikeEnv() for _ in range(3)]
+    single = [env.reset(seed=40 + i)[0] for i, env in enumerate(envs)]
+    assert list(info["deal"]) == [40, 41, 42]
+    for i in range(3):
+        for name, view in obs.items():
+            assert np.array_equal(view[i], single[i][name])
+
+    actions = [DRAW, DRAW, DRAW]
+    obs, rewards, *_ = vector_env.step(actions)
+    for i, env in enumerate(envs):
+        env_obs, reward, *_ = env.step(DRAW)
+        assert np.array_equal(obs["tableau"][i], env_obs["tableau"])
+        assert np.array_equal(obs["waste"][i], env_obs["waste"])
+        assert rewards[i] == reward
+
+
+def test_envs_reset_automatically():
+    vector_env = VectorKlondikeEnv(2, max_steps=2)
+    vector_env.reset(seed=5)
+    first = vector_env.step([DRAW, DRAW])[3].copy()
+    _, _, terminated, truncated, info = vector_env.step([DRAW, DRAW])
+    assert not first.any()
+    assert truncated.all() and not terminated.any()
+    assert list(info["deal"]) != [5, 6]
+    assert np.array_equal(vector_env.obs["hidden"], [list(range(7))] * 2)
+    assert np.shares_memory(vector_env.obs["tableau"], vector_env._arrays["obs"])
+
+
+def test_shared_memory_matches_sync():
+    with VectorKlondikeEnv(4, mode=SHARED_MEMORY, workers=2, max_steps=30) as shared:
+        shared_history = run(shared, 40)
+    sync_history = run(VectorKlondikeEnv(4, max_steps=30), 40)
+    for shared_step, sync_step in zip(shared_history, sync_history):
+        for name in shared_step[0]:
+            assert np.array_equal(shared_step[0][name], sync_step[0][name])
+        for a, b in zip(shared_step[1:], sync_step[1:]):
+            assert np.array_equal(a, b)
+    assert any(step[4].any() for step in shared_history[1:])  # some envs were reset
+
+
+def test_shared_memory_reports_illegal_actions():
+    with VectorKlondikeEnv(2, mode=SHARED_MEMORY, workers=2) as vector_env:
+        obs, _ = vector_env.reset(seed=1)
+        illegal = int(np.flatnonzero(~obs["action_mask"][1])[0])
+        with pytest.raises(ValueError):
+            vector_env.step([DRAW, illegal])
+
+
+def test_shared_memory_forwards_worker_errors(monkeypatch):
+    def fail(self, action):
+        raise KeyError("lost card")
+
+    monkeypatch.setattr(KlondikeEnv, "step", fail)  # inherited by the forked workers
+    with VectorKlondikeEnv(2, mode=SHARED_MEMORY, workers=2) as vector_env:
+        vector_env.reset(seed=1)
+        with pytest.raises(RuntimeError, match="KeyError: 'lost card'"):
+            vector_env.step([DRAW, DRAW])
+
+
+def test_rejects_unknown_mode():
+    with pytest.raises(ValueError):
+        VectorKlondikeEnv(2, mode="threads")